@@ -4,6 +4,7 @@ GAN Cube Bluetooth Packet Decoder Demo
 Educational demonstration of the complete decoding pipeline from raw encrypted hex to meaningful data.
 """
 
+import math
 import struct
 from typing import List, Tuple, Optional
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
@@ -41,8 +42,7 @@ class GanPacketDecoder:
         ])
 
         # Convert MAC to salt (reversed bytes)
-        mac_parts = mac_address.split(":")
-        self.salt = bytes([int(p, 16) for p in reversed(mac_parts)])
+        self.salt = bytes.fromhex(mac_address.replace(":", ""))[::-1]
 
         # Apply salt to key and IV (first 6 bytes)
         self.key = bytearray(self.base_key)
@@ -107,24 +107,22 @@ class GanPacketDecoder:
 
         return event_type, event_names.get(event_type, f"UNKNOWN_{event_type:02X}")
 
-    def bits_to_string(self, data: bytes) -> str:
-        """Convert bytes to bit string for bit-level parsing."""
-        return ''.join(f'{byte:08b}' for byte in data)
-
-    def get_bit_word(self, bits: str, offset: int, length: int) -> int:
-        """Extract bits from bit string."""
-        bit_slice = bits[offset:offset + length]
-        return int(bit_slice, 2) if bit_slice else 0
+    def get_bit_word(self, data: bytes, offset: int, length: int) -> int:
+        """Extract a big-endian bit field from the packet bytes."""
+        # Read only the bytes the field spans, then shift and mask it out
+        byte_lo = offset >> 3
+        byte_hi = (offset + length + 7) >> 3
+        raw = int.from_bytes(data[byte_lo:byte_hi], 'big')
+        shift = (byte_hi - byte_lo) * 8 - (offset & 7) - length
+        return (raw >> shift) & ((1 << length) - 1)
 
     def parse_orientation(self, data: bytes) -> dict:
         """Parse orientation/gyro event."""
-        bits = self.bits_to_string(data)
-
         # Extract quaternion components (16 bits each)
-        qw_raw = self.get_bit_word(bits, 4, 16)
-        qx_raw = self.get_bit_word(bits, 20, 16)
-        qy_raw = self.get_bit_word(bits, 36, 16)
-        qz_raw = self.get_bit_word(bits, 52, 16)
+        qw_raw = self.get_bit_word(data, 4, 16)
+        qx_raw = self.get_bit_word(data, 20, 16)
+        qy_raw = self.get_bit_word(data, 36, 16)
+        qz_raw = self.get_bit_word(data, 52, 16)
 
         # Convert to normalized quaternion
         # Format: sign bit (bit 15) + 15-bit magnitude normalized to [-1, 1]
@@ -147,8 +145,6 @@ class GanPacketDecoder:
 
     def quaternion_to_euler(self, x: float, y: float, z: float, w: float) -> dict:
         """Approximate Euler angles from quaternion."""
-        import math
-
         # Roll (x-axis rotation)
         sinr_cosp = 2 * (w * x + y * z)
         cosr_cosp = 1 - 2 * (x * x + y * y)
@@ -171,16 +167,14 @@ class GanPacketDecoder:
 
     def parse_move(self, data: bytes) -> dict:
         """Parse move event."""
-        bits = self.bits_to_string(data)
-
         # Extract serial number and moves
-        serial = self.get_bit_word(bits, 4, 8)
+        serial = self.get_bit_word(data, 4, 8)
 
         moves = []
         # Up to 7 moves can be packed in one event
         for i in range(7):
-            face = self.get_bit_word(bits, 12 + 5 * i, 4)
-            direction = self.get_bit_word(bits, 16 + 5 * i, 1)
+            face = self.get_bit_word(data, 12 + 5 * i, 4)
+            direction = self.get_bit_word(data, 16 + 5 * i, 1)
 
             # Check if this move slot is used (face < 6)
             if face < 6:
@@ -188,7 +182,7 @@ class GanPacketDecoder:
                 move_str = face_chars[face] + ("'" if direction == 1 else "")
 
                 # Extract timestamp for this move
-                elapsed = self.get_bit_word(bits, 47 + 16 * i, 16)
+                elapsed = self.get_bit_word(data, 47 + 16 * i, 16)
 
                 moves.append({
                     "face": face,
@@ -205,8 +199,7 @@ class GanPacketDecoder:
 
     def parse_battery(self, data: bytes) -> dict:
         """Parse battery event."""
-        bits = self.bits_to_string(data)
-        battery_percent = self.get_bit_word(bits, 8, 8)
+        battery_percent = self.get_bit_word(data, 8, 8)
 
         return {
             "type": "BATTERY",
@@ -3,25 +3,51 @@
 import asyncio
 from bleak import BleakScanner, BleakClient
 
-async def connect_and_stream():
-    devices = await BleakScanner.discover(timeout=10.0)
-    gan_cube = None
+try:
+    import uvloop  # optional; lower per-notification overhead than asyncio's loop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
-    for device in devices:
-        if device.name and ("GAN" in device.name.upper() or "GI" in device.name.upper()):
-            gan_cube = device
-            break
+async def connect_and_stream():
+    # Stop scanning on the first matching advertisement rather than
+    # always waiting out the full timeout
+    gan_cube = await BleakScanner.find_device_by_filter(
+        lambda device, _: bool(device.name) and ("GAN" in device.name.upper() or "GI" in device.name.upper()),
+        timeout=10.0
+    )
 
     if not gan_cube:
         return
 
-    async with BleakClient(gan_cube.address) as client:
+    # Set by bleak when the link drops, so the stream ends without polling
+    disconnected = asyncio.Event()
+
+    # The notification callback only enqueues; hex formatting and terminal
+    # writes happen in a separate task so slow output can't stall BLE
+    # delivery. Unbounded, so a slow terminal delays the dump but never
+    # loses packets
+    packets = asyncio.Queue()
+
+    async def printer():
+        while True:
+            lines = [(await packets.get()).hex()]
+            while not packets.empty():
+                lines.append(packets.get_nowait().hex())
+            print("\n".join(lines))
+
+    async with BleakClient(gan_cube.address, disconnected_callback=lambda _: disconnected.set()) as client:
         def handler(sender, data):
-            print(data.hex())
+            packets.put_nowait(bytes(data))
 
+        printer_task = asyncio.create_task(printer())
         await client.start_notify("28be4cb6-cd67-11e9-a32f-2a2ae2dbcce4", handler)
 
-        while True:
-            await asyncio.sleep(1)
+        await disconnected.wait()
+        printer_task.cancel()
+
+    # Print whatever was still queued when the link dropped
+    while not packets.empty():
+        print(packets.get_nowait().hex())
 
 asyncio.run(connect_and_stream())
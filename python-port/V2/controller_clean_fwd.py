@@ -22,6 +22,30 @@ from gan_web_bluetooth.protocols.base import (
     GanCubeBatteryEvent
 )
 
+# Action -> button lookups, built once rather than on every move
+_ACTION_BUTTONS = {
+    'gamepad_a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+    'gamepad_b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+    'gamepad_x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+    'gamepad_y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+    'gamepad_l1': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
+    'gamepad_r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+    'gamepad_r3': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
+    'gamepad_dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+    'gamepad_dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+    'gamepad_dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+    'gamepad_dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+}
+
+_COMBO_BUTTONS = {
+    'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+    'dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+    'dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+    'dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+    'dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+    'r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+}
+
 class CubeControllerClean:
     """Clean cube controller - pure async, no threads"""
 
@@ -168,14 +192,14 @@ class CubeControllerClean:
         move = event.move
         now_ms = time.perf_counter_ns() // 1_000_000
 
-        # Debug: show move arrival
-        if self.debug_moves:
-            print(f"[{time.perf_counter():.3f}] Move received: {move}")
+        # Debug: show move arrival; the outcome is appended to the same
+        # text so each move costs a single console write
+        debug = f"[{time.perf_counter():.3f}] Move received: {move}" if self.debug_moves else None
 
         # Duplicate check
         if move == self.last_move and (now_ms - self.last_move_time) < 50:
-            if self.debug_moves:
-                print(f"  -> Duplicate, skipping")
+            if debug:
+                print(f"{debug}\n  -> Duplicate, skipping")
             return
         self.last_move = move
         self.last_move_time = now_ms
@@ -184,18 +208,20 @@ class CubeControllerClean:
 
         # Special roll handling
         if move == "U'" and self.sprinting:
+            if debug:
+                print(debug)
             asyncio.create_task(self.execute_roll())
             return
 
         # Get mapping
         action = self.config.get('move_mappings', {}).get(move)
         if not action:
-            if self.debug_moves:
-                print(f"  -> No mapping found")
+            if debug:
+                print(f"{debug}\n  -> No mapping found")
             return
 
-        if self.debug_moves:
-            print(f"  -> Action: {action}")
+        if debug:
+            print(f"{debug}\n  -> Action: {action}")
 
         # Execute action with IMMEDIATE updates
         if action.startswith('gamepad_combo_'):
@@ -258,17 +284,8 @@ class CubeControllerClean:
         if len(combo) != 2:
             return
 
-        button_map = {
-            'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-            'dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
-            'dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
-            'dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
-            'dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
-            'r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-        }
-
-        b1 = button_map.get(combo[0])
-        b2 = button_map.get(combo[1])
+        b1 = _COMBO_BUTTONS.get(combo[0])
+        b2 = _COMBO_BUTTONS.get(combo[1])
 
         if b1 and b2:
             self.gamepad.press_button(b1)
@@ -285,20 +302,7 @@ class CubeControllerClean:
 
     def get_button(self, action):
         """Map action to button"""
-        button_map = {
-            'gamepad_a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-            'gamepad_b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-            'gamepad_x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-            'gamepad_y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-            'gamepad_l1': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-            'gamepad_r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-            'gamepad_r3': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
-            'gamepad_dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
-            'gamepad_dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
-            'gamepad_dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
-            'gamepad_dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
-        }
-        return button_map.get(action)
+        return _ACTION_BUTTONS.get(action)
 
     def apply_calibration(self, qx, qy, qz, qw):
         """Apply calibration quaternion math"""
@@ -423,13 +427,12 @@ class CubeControllerClean:
         print("⌨️  F5: Calibrate | F6: Reset camera | F7: Debug")
         print("⌨️  F9: Config 1 | F10: Config 2")
 
-        # Keep running to handle keyboard events
-        while True:
-            await asyncio.sleep(0.1)
+        # Hotkeys fire on the keyboard module's own thread; just stay alive
+        await asyncio.Future()
 
     async def connect(self):
         """Simple connection"""
-        self.cube = GanSmartCube()
+        self.cube = GanSmartCube(orientation_flush_interval=None)
 
         # Direct handlers - NO executor.submit()
         self.cube.on('orientation', self.handle_orientation)
@@ -16,6 +16,7 @@ import queue
 import keyboard
 import vgamepad as vg
 import math
+import traceback
 
 # Add parent directory to import gan_web_bluetooth
 sys.path.append(str(Path(__file__).parent.parent))
@@ -371,7 +372,7 @@ class CubeControllerV2Fixed:
         """Connect to cube"""
         print("Connecting to cube...")
         
-        self.cube = GanSmartCube()
+        self.cube = GanSmartCube(orientation_flush_interval=None)
         
         # Process both moves and orientation in thread pool to avoid blocking
         self.cube.on('move', lambda e: self.executor.submit(self.process_move, e))
@@ -660,7 +661,6 @@ if __name__ == "__main__":
         print("\nShutdown complete")
     except Exception as e:
         print(f"Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 """
@@ -680,6 +680,7 @@ import threading
 import keyboard
 import vgamepad as vg
 import os
+import traceback
 
 # Add parent directory to import gan_web_bluetooth
 sys.path.append(str(Path(__file__).parent.parent))
@@ -927,7 +928,7 @@ class CubeControllerV2:
         print("Connecting to cube...")
         
         # Create cube instance
-        self.cube = GanSmartCube()
+        self.cube = GanSmartCube(orientation_flush_interval=None)
         
         # Setup event handlers
         self.cube.on('move', self._handle_move)
@@ -1326,7 +1327,7 @@ class CubeControllerV2:
     
     async def print_stats_loop(self):
         """Print performance statistics and check for config changes"""
-        last_check_time = time.time()
+        last_check_time = time.monotonic()
         
         while True:
             await asyncio.sleep(5)
@@ -1339,7 +1340,7 @@ class CubeControllerV2:
                 print(f"\n📊 Stats: {runtime:.0f}s | Orientation: {orientation_rate:.1f}Hz | Moves: {move_rate:.2f}Hz")
             
             # Check for config file changes (every 5 seconds)
-            now = time.time()
+            now = time.monotonic()
             if self.config_path and now - last_check_time > 5:
                 try:
                     current_mtime = os.path.getmtime(self.config_path)
@@ -1371,7 +1372,6 @@ class CubeControllerV2:
             print("\nShutting down...")
         except Exception as e:
             print(f"Error: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             # Cleanup
@@ -1404,6 +1404,5 @@ if __name__ == "__main__":
         print("\nShutdown complete")
     except Exception as e:
         print(f"Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -4,11 +4,20 @@ Cube Performance Diagnostic - Measure actual Hz/latency from GAN cube
 """
 
 import asyncio
+import signal
 import time
 import sys
 from pathlib import Path
 from collections import deque
 
+try:
+    # Measure on uvloop when available so the loop itself adds as little
+    # callback latency as possible; Windows falls back to asyncio's loop
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 sys.path.append(str(Path(__file__).parent.parent))
 from gan_web_bluetooth import GanSmartCube
 from gan_web_bluetooth.protocols.base import (
@@ -33,6 +42,9 @@ class CubeDiagnostic:
         self.move_count = 0
         self.start_time = 0
         
+        # Set by Ctrl+C to end the run
+        self.stop_event = asyncio.Event()
+        
         # Latency tracking
         self.orientation_intervals = deque(maxlen=100)
         self.move_intervals = deque(maxlen=100)
@@ -107,7 +119,7 @@ class CubeDiagnostic:
         print("="*50)
     
     async def connect(self):
-        self.cube = GanSmartCube()
+        self.cube = GanSmartCube(orientation_flush_interval=None)
         
         self.cube.on('orientation', self.handle_orientation)
         self.cube.on('move', self.handle_move)
@@ -128,12 +140,19 @@ class CubeDiagnostic:
         print("="*50 + "\n")
         
         try:
-            while True:
-                await asyncio.sleep(5)
+            asyncio.get_running_loop().add_signal_handler(signal.SIGINT, self.stop_event.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C falls back to asyncio.run's KeyboardInterrupt
+        
+        # Stats every 5 s, but wake the moment a stop is requested
+        while not self.stop_event.is_set():
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 self.print_stats()
-        except KeyboardInterrupt:
-            print("\n\nFINAL STATS:")
-            self.print_stats()
+        
+        print("\n\nFINAL STATS:")
+        self.print_stats()
 
 
 async def main():
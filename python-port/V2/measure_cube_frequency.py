@@ -10,6 +10,14 @@ import sys
 from collections import defaultdict, deque
 from pathlib import Path
 
+try:
+    # uvloop's libuv loop cuts per-notification callback overhead; it is
+    # optional (and unavailable on Windows), so fall back to asyncio's loop
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Add parent directory to path to import gan_web_bluetooth
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -36,7 +44,7 @@ class CubeFrequencyAnalyzer:
     async def connect(self):
         """Connect to the cube and setup event handlers."""
         print("Scanning for GAN cube...")
-        self.cube = GanSmartCube()
+        self.cube = GanSmartCube(orientation_flush_interval=None)
         
         # Setup event handlers
         self.cube.on('move', self.on_move)
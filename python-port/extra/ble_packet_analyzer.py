@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
 import asyncio
+import signal
+import sys
 import time
 from collections import deque
 from bleak import BleakClient, BleakScanner
 
+try:
+    # uvloop's libuv loop cuts per-notification callback overhead; it is
+    # optional (and unavailable on Windows), so fall back to asyncio's loop
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 CUBE_SERVICE_UUID = "6e400001-b5a3-f393-e0a9-e50e24dc4179"
 CUBE_CHARACTERISTIC_UUID = "6e400003-b5a3-f393-e0a9-e50e24dc4179"
 
+# Label for every possible command byte, so tagging a packet is one index
+# instead of a compare chain plus an f-string for unknown bytes
+_KNOWN_PACKET_TYPES = {
+    0x2a: "ORIENTATION",
+    0x33: "MOVE",
+    0x37: "FACELETS",
+    0x32: "BATTERY",
+    0x23: "HARDWARE",
+}
+_PACKET_TYPES = tuple(
+    _KNOWN_PACKET_TYPES.get(cmd, f"UNKNOWN(0x{cmd:02x})") for cmd in range(256)
+)
+
 class PacketAnalyzer:
     def __init__(self):
         self.packet_times = deque(maxlen=100)
@@ -17,6 +40,23 @@ class PacketAnalyzer:
         self.last_data = None
         self.delays = deque(maxlen=100)
         
+        # Packet lines buffered for one write per flush interval
+        self._pending_lines = []
+        
+    def _emit(self, line):
+        """Buffer an output line; the first line of a batch schedules its flush."""
+        self._pending_lines.append(line)
+        if len(self._pending_lines) == 1:
+            asyncio.get_running_loop().call_later(0.1, self.flush)
+    
+    def flush(self):
+        """Write all buffered packet lines in a single call."""
+        if self._pending_lines:
+            self._pending_lines.append('')
+            sys.stdout.write('\n'.join(self._pending_lines))
+            sys.stdout.flush()
+            self._pending_lines.clear()
+        
     def process_packet(self, data):
         current_time = time.time()
         self.total_packets += 1
@@ -51,7 +91,7 @@ class PacketAnalyzer:
         # Decode packet type
         packet_type = self._decode_packet_type(data)
         
-        print(f"[{current_time:.3f}] {delay_str} | {len(data):2d} bytes | {data.hex()} | {packet_type}{duplicate_marker}")
+        self._emit(f"[{current_time:.3f}] {delay_str} | {len(data):2d} bytes | {data.hex()} | {packet_type}{duplicate_marker}")
         
         return delay_str
     
@@ -59,21 +99,11 @@ class PacketAnalyzer:
         if len(data) == 0:
             return "EMPTY"
         
-        cmd = data[0]
-        if cmd == 0x2a:
-            return "ORIENTATION"
-        elif cmd == 0x33:
-            return "MOVE"
-        elif cmd == 0x37:
-            return "FACELETS"
-        elif cmd == 0x32:
-            return "BATTERY"
-        elif cmd == 0x23:
-            return "HARDWARE"
-        else:
-            return f"UNKNOWN(0x{cmd:02x})"
+        return _PACKET_TYPES[data[0]]
     
     def print_stats(self):
+        # Keep buffered packet lines ahead of the summary
+        self.flush()
         if len(self.packet_times) > 1:
             time_span = self.packet_times[-1] - self.packet_times[0]
             rate = len(self.packet_times) / time_span if time_span > 0 else 0
@@ -95,12 +125,15 @@ class PacketAnalyzer:
 
 async def find_cube():
     print("🔍 Scanning for GAN cube...")
-    devices = await BleakScanner.discover()
-    for device in devices:
-        if device.name and "GAN" in device.name:
-            print(f"✅ Found: {device.name} at {device.address}")
-            return device.address
-    return None
+    # Returns on the first matching advertisement instead of waiting out
+    # the whole discovery window
+    device = await BleakScanner.find_device_by_filter(
+        lambda d, _: bool(d.name) and "GAN" in d.name
+    )
+    if device is None:
+        return None
+    print(f"✅ Found: {device.name} at {device.address}")
+    return device.address
 
 async def analyze_ble_stream():
     address = await find_cube()
@@ -122,7 +155,15 @@ async def analyze_ble_stream():
     
     print(f"🔗 Connecting to {address}...")
     
-    async with BleakClient(address) as client:
+    # Set by bleak when the link drops or by Ctrl+C, so the stream ends
+    # without polling and the cleanup below still runs
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        pass  # Windows: Ctrl+C falls back to asyncio.run's KeyboardInterrupt
+    
+    async with BleakClient(address, disconnected_callback=lambda _: stop.set()) as client:
         print(f"✅ Connected!")
         
         # List all services and characteristics for debugging
@@ -167,13 +208,11 @@ async def analyze_ble_stream():
         print("Format: [timestamp] delay | size | hex_data | type")
         print("="*70 + "\n")
         
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            print("\n🛑 Stopping...")
+        await stop.wait()
         
-        await client.stop_notify(char.uuid)
+        if client.is_connected:
+            print("\n🛑 Stopping...")
+            await client.stop_notify(char.uuid)
         analyzer.print_stats()
         print("👋 Disconnected")
 
@@ -8,7 +8,6 @@ Windows only - requires vgamepad
 import asyncio
 import websockets
 import json
-import time
 import sys
 import os
 from typing import Dict, Set, Any, Optional
@@ -16,6 +15,13 @@ from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # orjson parses each incoming frame several times faster than json;
+    # its JSONDecodeError subclasses json's, so error handling is unchanged
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Gamepad imports
 try:
     import vgamepad as vg
@@ -25,6 +31,39 @@ except ImportError:
     print("This controller bridge requires Windows and vgamepad")
     sys.exit(1)
 
+# Combo button names -> vgamepad constants, built once rather than per combo
+_COMBO_BUTTONS = {
+    'a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+    'b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+    'x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+    'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+    'l1': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
+    'r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+    'l3': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,
+    'r3': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
+    'dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+    'dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+    'dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+    'dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+    'back': vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
+    'start': vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
+}
+
+# Tap actions -> the button they press and release, so resolving a mapped
+# action is one dict lookup instead of walking a string-compare chain
+_PRESS_BUTTONS = {
+    'gamepad_r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+    'gamepad_b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+    'gamepad_a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+    'gamepad_x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+    'gamepad_y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+    'gamepad_r3': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
+    'gamepad_dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+    'gamepad_dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+    'gamepad_dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+    'gamepad_dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+}
+
 @dataclass
 class ControllerConfig:
     """Configuration for controller mappings and sensitivity"""
@@ -116,7 +155,10 @@ class CrossPlatformController:
         self.config = config or ControllerConfig.load_from_json(config_path)
         self.config_mtime = self._get_config_mtime()
         
-        self.last_input_time = 0
+        # Newest orientation not yet applied, and the task applying it at
+        # most once per rate_limit_ms
+        self._pending_orientation: Optional[Dict[str, Any]] = None
+        self._orientation_task: Optional[asyncio.Task] = None
         self.connected_clients: Set = set()
         
         # Sprint/Roll management
@@ -134,6 +176,16 @@ class CrossPlatformController:
         
         # Thread pool for non-blocking gamepad updates
         self.executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Message type -> handler, so each frame costs one dict lookup
+        self._handlers = {
+            'CUBE_MOVE': self.handle_cube_move,
+            'CUBE_ORIENTATION': self.handle_orientation,
+            'KEY_PRESS': self.handle_key_press,
+            'KEY_RELEASE': self.handle_key_release,
+            'MOUSE_CLICK': self.handle_mouse_click,
+            'MOUSE_MOVE': self.handle_mouse_move,
+        }
                 
         print("Gamepad controller bridge initialized")
         print(f"Loaded {len(self.config.move_mappings)} move mappings")
@@ -143,20 +195,9 @@ class CrossPlatformController:
         # Check for config file changes before processing messages
         self._check_and_reload_config()
         
-        msg_type = data.get('type', '')
-        
-        if msg_type == 'CUBE_MOVE':
-            await self.handle_cube_move(data)
-        elif msg_type == 'CUBE_ORIENTATION':
-            await self.handle_orientation(data)
-        elif msg_type == 'KEY_PRESS':
-            await self.handle_key_press(data)
-        elif msg_type == 'KEY_RELEASE':
-            await self.handle_key_release(data)
-        elif msg_type == 'MOUSE_CLICK':
-            await self.handle_mouse_click(data)
-        elif msg_type == 'MOUSE_MOVE':
-            await self.handle_mouse_move(data)
+        handler = self._handlers.get(data.get('type'))
+        if handler:
+            await handler(data)
     
     async def handle_cube_move(self, data: Dict[str, Any]):
         """Handle cube face moves and convert to game input"""
@@ -196,9 +237,29 @@ class CrossPlatformController:
     
     async def handle_orientation(self, data: Dict[str, Any]):
         """Handle cube orientation for analog movement"""
-        if not self._should_process_input():
-            return
-            
+        # Samples inside the rate limit window are coalesced rather than
+        # dropped, so the newest tilt is always applied once the window ends
+        self._pending_orientation = data
+        if self._orientation_task is None:
+            self._orientation_task = asyncio.create_task(self._flush_orientation())
+    
+    async def _flush_orientation(self):
+        """Apply the newest pending orientation, then wait out the rate limit"""
+        try:
+            while self._pending_orientation is not None:
+                data = self._pending_orientation
+                self._pending_orientation = None
+                try:
+                    await self._apply_orientation(data)
+                except Exception as e:
+                    # Nobody awaits this task, so report here and keep going
+                    print(f"Error processing message: {e}")
+                await asyncio.sleep(self.config.rate_limit_ms / 1000)
+        finally:
+            self._orientation_task = None
+    
+    async def _apply_orientation(self, data: Dict[str, Any]):
+        """Convert an orientation message to analog stick positions"""
         tilt_x = data.get('tiltX', 0.0)  # Left/Right tilt
         tilt_y = data.get('tiltY', 0.0)  # Forward/Back tilt  
         spin_z = data.get('spinZ', 0.0)  # Rotation around vertical axis
@@ -318,30 +379,13 @@ class CrossPlatformController:
         """Execute gamepad-specific actions"""
             
         try:
-            if action == "gamepad_r1":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER)
+            button = _PRESS_BUTTONS.get(action)
+            if button is not None:
+                await self._gamepad_button_press(button)
             elif action == "gamepad_r2":
                 await self._gamepad_trigger_press('right')
             elif action == "gamepad_l2":
                 await self._gamepad_trigger_press('left')
-            elif action == "gamepad_b":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_B)
-            elif action == "gamepad_a":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_A)
-            elif action == "gamepad_x":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_X)
-            elif action == "gamepad_y":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_Y)
-            elif action == "gamepad_r3":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB)
-            elif action == "gamepad_dpad_right":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT)
-            elif action == "gamepad_dpad_left":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT)
-            elif action == "gamepad_dpad_down":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN)
-            elif action == "gamepad_dpad_up":
-                await self._gamepad_button_press(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP)
             elif action == "gamepad_b_hold":
                 # Only hold if not already held and not rolling
                 if not self.b_button_held_by_sprint and not self.rolling_in_progress:
@@ -361,24 +405,6 @@ class CrossPlatformController:
         # Parse combo format: gamepad_combo_y+dpad_down
         combo_part = action.replace('gamepad_combo_', '')
         
-        # Map button names to vgamepad constants
-        button_map = {
-            'a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-            'b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-            'x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-            'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-            'l1': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-            'r1': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-            'l3': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,
-            'r3': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
-            'dpad_up': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
-            'dpad_down': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
-            'dpad_left': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
-            'dpad_right': vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
-            'back': vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
-            'start': vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
-        }
-        
         try:
             # Split by + to get the buttons
             buttons = combo_part.split('+')
@@ -388,8 +414,8 @@ class CrossPlatformController:
             hold_button_name = buttons[0].strip()
             press_button_name = buttons[1].strip()
             
-            hold_button = button_map.get(hold_button_name)
-            press_button = button_map.get(press_button_name)
+            hold_button = _COMBO_BUTTONS.get(hold_button_name)
+            press_button = _COMBO_BUTTONS.get(press_button_name)
             
             if not hold_button or not press_button:
                 return
@@ -519,14 +545,6 @@ class CrossPlatformController:
         except Exception as e:
             print(f"Error reloading config: {e}")
     
-    def _should_process_input(self) -> bool:
-        """Check if we should process input based on rate limiting"""
-        current_time = time.time() * 1000  # Convert to milliseconds
-        if current_time - self.last_input_time < self.config.rate_limit_ms:
-            return False
-        self.last_input_time = current_time
-        return True
-    
     async def release_all_inputs(self):
         """Release all currently active inputs and reset gamepad"""
         # Reset sprint state
@@ -534,6 +552,9 @@ class CrossPlatformController:
         self.b_button_held_by_sprint = False
         self.rolling_in_progress = False
         
+        # Drop any orientation still waiting to be applied
+        self._pending_orientation = None
+        
         # Release any auto-held buttons
         for attr_name in dir(self):
             if attr_name.startswith('_auto_button_') and attr_name.endswith('_held'):
@@ -560,7 +581,7 @@ class ControllerBridgeServer:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     await self.controller.handle_message(data)
                 except json.JSONDecodeError as e:
                     print(f"Invalid JSON: {e}")
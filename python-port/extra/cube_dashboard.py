@@ -10,6 +10,7 @@ import os
 import threading
 import time
 import websockets
+from functools import partial
 from typing import Optional, Dict, Any
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit
@@ -17,9 +18,17 @@ import sys
 from pathlib import Path
 from gan_web_bluetooth import GanSmartCube
 from gan_web_bluetooth.protocols.base import (GanCubeMoveEvent, GanCubeFaceletsEvent, GanCubeOrientationEvent, GanCubeBatteryEvent, GanCubeHardwareEvent)
-from gan_web_bluetooth.utils import now
+from gan_web_bluetooth.utils import now, Quaternion
 from diagnostic_logger import DiagnosticLogger, AsyncDiagnosticHelper
 
+try:
+    # orjson encodes each bridge frame several times faster than json; its
+    # bytes go out as binary frames, which the bridge's loads accepts as-is
+    import orjson
+    _json_dumps = partial(orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _json_dumps = json.dumps
+
 class CubeDashboardServer:
     
     def __init__(self, config_path="controller_config.json"):
@@ -36,6 +45,7 @@ class CubeDashboardServer:
         self.cube_loop: Optional[asyncio.AbstractEventLoop] = None
         self.is_connected = False
         self.connection_status = "disconnected"
+        self._disconnected_event: Optional[asyncio.Event] = None
         
         # Event queue for async processing
         self.event_queue = None  # Will be initialized as asyncio.Queue
@@ -265,6 +275,7 @@ class CubeDashboardServer:
             # Initialize async helper and event queue
             self.async_helper = AsyncDiagnosticHelper(self.diagnostics)
             self.event_queue = asyncio.Queue(maxsize=1000)
+            self._disconnected_event = asyncio.Event()
             
             self.diagnostics.log_event("connection", "Starting cube connection", {
                 'device_address': device_address
@@ -276,7 +287,9 @@ class CubeDashboardServer:
             # Give the processor a moment to start
             await asyncio.sleep(0.1)
             
-            # Create cube instance
+            # Create cube instance; orientation keeps the default ~30 Hz
+            # throttle since every sample is queued, emitted over Socket.IO
+            # and forwarded to the bridge, none of which needs the raw rate
             self.cube = GanSmartCube()
             
             # Setup event handlers - these will just queue events
@@ -292,16 +305,13 @@ class CubeDashboardServer:
             self.socketio.emit('message', {'type': 'info', 'text': 'Scanning for cube...'})
             await self.cube.connect(device_address)
             
-            # Wait for disconnection - check event loop responsiveness
-            loop_check_counter = 0
-            while self.is_connected:
-                await asyncio.sleep(0.1)
-                loop_check_counter += 1
-                
-                # Check event loop responsiveness every second
-                if loop_check_counter >= 10:
+            # Wait for disconnection; the event wakes us immediately, the
+            # timeout once a second to check event loop responsiveness
+            while not self._disconnected_event.is_set():
+                try:
+                    await asyncio.wait_for(self._disconnected_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
                     self.diagnostics.check_event_loop_responsiveness()
-                    loop_check_counter = 0
                     
                     # Check queue size
                     queue_size = self.event_queue.qsize()
@@ -343,45 +353,27 @@ class CubeDashboardServer:
     
     async def _process_event_queue(self):
         """Process events from the queue asynchronously."""
-        startup_time = time.time()
+        # Event type -> async handler, resolved with one dict lookup per event
+        handlers = {
+            'move': self._handle_move_event_async,
+            'facelets': self._handle_facelets_event_async,
+            'orientation': self._handle_orientation_event_async,
+            'battery': self._handle_battery_event_async,
+            'hardware': self._handle_hardware_event_async,
+            'connected': self._handle_connected_event_async,
+            'disconnected': self._handle_disconnected_event_async,
+        }
         
-        # Keep processing until we explicitly stop
+        # Runs until _connect_and_monitor_cube cancels it after disconnect;
+        # get() blocks with no timeout, so an idle queue costs no wakeups
         while True:
             try:
-                # Don't stop during the first 10 seconds (startup period)
-                if time.time() - startup_time < 10:
-                    pass  # Keep running during startup
-                # After startup, check if we should stop
-                elif not self.is_connected and self.event_queue.empty():
-                    # If disconnected and queue is empty after startup, we can exit
-                    await asyncio.sleep(0.5)
-                    if not self.is_connected and self.event_queue.empty():
-                        break
-                
-                # Get event with timeout to allow checking connection status
-                try:
-                    event_type, event = await asyncio.wait_for(
-                        self.event_queue.get(), 
-                        timeout=0.1
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                event_type, event = await self.event_queue.get()
                 
                 # Process event based on type
-                if event_type == 'move':
-                    await self._handle_move_event_async(event)
-                elif event_type == 'facelets':
-                    await self._handle_facelets_event_async(event)
-                elif event_type == 'orientation':
-                    await self._handle_orientation_event_async(event)
-                elif event_type == 'battery':
-                    await self._handle_battery_event_async(event)
-                elif event_type == 'hardware':
-                    await self._handle_hardware_event_async(event)
-                elif event_type == 'connected':
-                    await self._handle_connected_event_async(event)
-                elif event_type == 'disconnected':
-                    await self._handle_disconnected_event_async(event)
+                handler = handlers.get(event_type)
+                if handler:
+                    await handler(event)
                 
                 # Yield control periodically to prevent blocking
                 await asyncio.sleep(0)
@@ -400,7 +392,7 @@ class CubeDashboardServer:
     
     async def _handle_move_event_async(self, event: GanCubeMoveEvent):
         """Handle move event from cube."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         print(f"Move: {event.move} (Serial: {event.serial})")
         
         self.diagnostics.track_message('moves')
@@ -424,10 +416,10 @@ class CubeDashboardServer:
         
         # Emit to dashboard immediately for maximum responsiveness
         try:
-            emit_start = time.time()
+            emit_start = time.perf_counter()
             self.socketio.emit('move', move_data)
             self.emit_move_history()
-            self.diagnostics.track_timing('socketio_emit', (time.time() - emit_start) * 1000)
+            self.diagnostics.track_timing('socketio_emit', (time.perf_counter() - emit_start) * 1000)
             self.diagnostics.track_message('socketio_emit')
             
             # Forward to controller bridge if enabled and connected
@@ -439,7 +431,7 @@ class CubeDashboardServer:
             self.diagnostics.log_event("move", "Error emitting move event", error=e)
         
         # Track total processing time
-        self.diagnostics.track_timing('move_processing', (time.time() - start_time) * 1000)
+        self.diagnostics.track_timing('move_processing', (time.perf_counter() - start_time) * 1000)
     
     async def _handle_facelets_event_async(self, event: GanCubeFaceletsEvent):
         """Handle facelets event from cube."""
@@ -449,10 +441,8 @@ class CubeDashboardServer:
             'facelets': event.facelets,
             'serial': event.serial,
             'timestamp': now(),
-            'cp': event.state.CP if event.state else None,
-            'co': event.state.CO if event.state else None,
-            'ep': event.state.EP if event.state else None,
-            'eo': event.state.EO if event.state else None
+            **(event.state.to_lists() if event.state else
+               {'cp': None, 'co': None, 'ep': None, 'eo': None})
         }
         
         # Emit immediately to dashboard for fast updates
@@ -463,7 +453,7 @@ class CubeDashboardServer:
     
     async def _handle_orientation_event_async(self, event: GanCubeOrientationEvent):
         """Handle orientation event from cube - fast dashboard updates with limited debug output."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         current_time = now()
         
         self.diagnostics.track_message('orientation')
@@ -565,9 +555,9 @@ class CubeDashboardServer:
             else:
                 orientation_with_calibrated['is_calibrated'] = False
             
-            emit_start = time.time()
+            emit_start = time.perf_counter()
             self.socketio.emit('orientation', orientation_with_calibrated)
-            self.diagnostics.track_timing('socketio_emit', (time.time() - emit_start) * 1000)
+            self.diagnostics.track_timing('socketio_emit', (time.perf_counter() - emit_start) * 1000)
             self.diagnostics.track_message('socketio_emit')
             self.last_orientation_emit = current_time
             
@@ -577,7 +567,6 @@ class CubeDashboardServer:
                 quat_for_controller = calibrated_quat if calibrated_quat is not None else raw_quat
                 
                 # Create a quaternion object for the controller processing
-                from gan_web_bluetooth.utils import Quaternion
                 controller_quat = Quaternion(
                     x=quat_for_controller['x'],
                     y=quat_for_controller['y'], 
@@ -624,7 +613,7 @@ class CubeDashboardServer:
                 self.last_emit_error = current_time
         
         # Track total processing time
-        self.diagnostics.track_timing('orientation_processing', (time.time() - start_time) * 1000)
+        self.diagnostics.track_timing('orientation_processing', (time.perf_counter() - start_time) * 1000)
     
     async def _handle_battery_event_async(self, event: GanCubeBatteryEvent):
         """Handle battery event from cube."""
@@ -669,6 +658,8 @@ class CubeDashboardServer:
         """Handle cube disconnected event."""
         self.is_connected = False
         self.connection_status = "disconnected"
+        if self._disconnected_event:
+            self._disconnected_event.set()
         
         self.socketio.emit('message', {'type': 'info', 'text': 'Disconnected from cube'})
         self.emit_status_update()
@@ -677,11 +668,13 @@ class CubeDashboardServer:
         """Request initial cube information."""
         try:
             await asyncio.sleep(0.5)  # Give time for connection to stabilize
-            await self.cube.request_hardware_info()
-            await asyncio.sleep(0.2)
-            await self.cube.request_battery()
-            await asyncio.sleep(0.2)
-            state = await self.cube.get_state()
+            # The three requests are independent, so issue them together
+            # rather than spacing them out with fixed sleeps
+            await asyncio.gather(
+                self.cube.request_hardware_info(),
+                self.cube.request_battery(),
+                self.cube.get_state()
+            )
         except Exception as e:
             print(f"Error requesting initial info: {e}")
     
@@ -780,8 +773,6 @@ class CubeDashboardServer:
     def _process_orientation_for_controller(self, quaternion, current_time):
         """Process orientation data for analog joystick control. 
         Quaternion is already calibrated when passed to this function."""
-        import math
-        
         # The quaternion passed here is already calibrated, so just use it directly
         transformed_quat = {
             'x': quaternion.x,
@@ -963,12 +954,12 @@ class CubeDashboardServer:
 
     async def _send_to_bridge(self, message: Dict[str, Any]):
         """Send message to controller bridge WebSocket."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             if self.controller_bridge_ws:
-                await self.controller_bridge_ws.send(json.dumps(message))
+                await self.controller_bridge_ws.send(_json_dumps(message))
                 self.diagnostics.track_message('websocket_send')
-                self.diagnostics.track_timing('bridge_send', (time.time() - start_time) * 1000)
+                self.diagnostics.track_timing('bridge_send', (time.perf_counter() - start_time) * 1000)
         except (websockets.exceptions.ConnectionClosed, websockets.exceptions.ConnectionClosedError, websockets.exceptions.ConnectionClosedOK) as e:
             # Handle connection closed exceptions
             self.bridge_connected = False
@@ -984,7 +975,7 @@ class CubeDashboardServer:
                 self.diagnostics.log_event("bridge", "Connection issue", error=e)
             else:
                 if hasattr(self, 'last_bridge_error_time'):
-                    current_time = time.time() * 1000
+                    current_time = time.monotonic() * 1000
                     if current_time - self.last_bridge_error_time > 5000:  # Rate limit error messages
                         print(f"Error sending to controller bridge: {e}")
                         self.diagnostics.log_event("bridge", "Send error", error=e)
@@ -992,7 +983,7 @@ class CubeDashboardServer:
                 else:
                     print(f"Error sending to controller bridge: {e}")
                     self.diagnostics.log_event("bridge", "Send error", error=e)
-                    self.last_bridge_error_time = time.time() * 1000
+                    self.last_bridge_error_time = time.monotonic() * 1000
     
     def run(self, host='localhost', port=5000, debug=False):
         """Run the dashboard server."""
@@ -1008,7 +999,6 @@ class CubeDashboardServer:
 
 if __name__ == "__main__":
     # Create templates directory if it doesn't exist
-    import os
     os.makedirs('templates', exist_ok=True)
     os.makedirs('static', exist_ok=True)
     
@@ -26,8 +26,9 @@ class DiagnosticLogger:
         self.log_file = os.path.join(log_dir, f"dashboard_diagnostics_{timestamp}.jsonl")
         self.metrics_file = os.path.join(log_dir, f"dashboard_metrics_{timestamp}.csv")
         
-        # Performance tracking
-        self.start_time = time.time()
+        # Performance tracking; uptimes and intervals use the monotonic
+        # clock so NTP or manual clock changes can't skew them
+        self.start_time = time.monotonic()
         self.message_counts = {
             'orientation': 0,
             'moves': 0,
@@ -61,7 +62,7 @@ class DiagnosticLogger:
         
         # Event loop monitoring
         self.loop_blocked_times = deque(maxlen=100)
-        self.last_loop_check = time.time()
+        self.last_loop_check = time.monotonic()
         
         # Error tracking
         self.error_counts = {}
@@ -90,7 +91,7 @@ class DiagnosticLogger:
         try:
             log_entry = {
                 'timestamp': time.time(),
-                'uptime': time.time() - self.start_time,
+                'uptime': time.monotonic() - self.start_time,
                 'category': category,
                 'event': event,
                 'data': data or {}
@@ -141,7 +142,7 @@ class DiagnosticLogger:
     
     def check_event_loop_responsiveness(self):
         """Check if event loop is responsive."""
-        current_time = time.time()
+        current_time = time.monotonic()
         blocked_time = (current_time - self.last_loop_check) * 1000  # ms
         self.last_loop_check = current_time
         
@@ -155,6 +156,10 @@ class DiagnosticLogger:
     
     def _monitor_loop(self):
         """Background thread to periodically collect system metrics."""
+        # Deadline for the next periodic summary; advancing it by a fixed
+        # step fires exactly once per 30 s window however the 1 s ticks land
+        next_summary = self.start_time + 30.0
+        
         while self.monitoring:
             try:
                 # Collect metrics
@@ -182,7 +187,7 @@ class DiagnosticLogger:
                 # Write metrics to CSV
                 metrics_row = [
                     datetime.now().isoformat(),
-                    f"{time.time() - self.start_time:.1f}",
+                    f"{time.monotonic() - self.start_time:.1f}",
                     f"{memory_mb:.1f}",
                     f"{memory_delta:.1f}",
                     f"{cpu_percent:.1f}",
@@ -205,7 +210,8 @@ class DiagnosticLogger:
                     f.write(','.join(metrics_row) + '\n')
                 
                 # Log summary every 30 seconds
-                if int(time.time() - self.start_time) % 30 == 0:
+                if time.monotonic() >= next_summary:
+                    next_summary += 30.0
                     self.log_event("metrics", "Periodic summary", {
                         'memory_mb': memory_mb,
                         'memory_delta_mb': memory_delta,
@@ -228,7 +234,7 @@ class DiagnosticLogger:
         
         # Final summary
         self.log_event("system", "Diagnostic logging shutdown", {
-            'total_uptime': time.time() - self.start_time,
+            'total_uptime': time.monotonic() - self.start_time,
             'final_memory_mb': self.process.memory_info().rss / 1024 / 1024,
             'total_messages': dict(self.message_counts),
             'total_errors': dict(self.error_counts)
@@ -246,14 +252,14 @@ class AsyncDiagnosticHelper:
     
     async def timed_operation(self, operation: str, coro):
         """Execute a coroutine and track its timing."""
-        start = time.time()
+        start = time.perf_counter()
         try:
             result = await coro
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             self.logger.track_timing(operation, duration_ms)
             return result
         except Exception as e:
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             self.logger.track_timing(operation, duration_ms)
             self.logger.log_event(operation, "Operation failed", error=e)
             raise
\ No newline at end of file
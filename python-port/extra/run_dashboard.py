@@ -6,7 +6,8 @@ Checks dependencies and starts the web server.
 
 import sys
 import subprocess
-import importlib
+import traceback
+import importlib.util
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -18,13 +19,14 @@ def check_dependencies():
     
     missing_packages = []
     
+    # find_spec only resolves the module; it doesn't run Flask/SocketIO's
+    # import-time side effects like import_module would
     for package_name, display_name in required_packages:
-        try:
-            importlib.import_module(package_name)
-            print(f"{display_name}")
-        except ImportError:
+        if importlib.util.find_spec(package_name) is None:
             missing_packages.append(display_name)
             print(f"{display_name} - Missing")
+        else:
+            print(f"{display_name}")
     
     return missing_packages
 
@@ -56,6 +58,12 @@ def install_missing_packages(packages):
 def main():
     """Main launcher function."""
     print("=" * 40)
+    
+    # Dependency checking/installing is opt-in so normal launches start fast
+    if '--auto-install' in sys.argv[1:]:
+        if not install_missing_packages(check_dependencies()):
+            return 1
+    
     print("Dashboard at: http://localhost:5000")
     
     try:
@@ -70,7 +78,6 @@ def main():
         return 0
     except Exception as e:
         print(f"\nError starting dashboard: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
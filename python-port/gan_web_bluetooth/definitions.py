@@ -18,7 +18,7 @@ GAN_GEN4_COMMAND_CHARACTERISTIC = "0000fff5-0000-1000-8000-00805f9b34fb"
 GAN_GEN4_STATE_CHARACTERISTIC = "0000fff6-0000-1000-8000-00805f9b34fb"
 
 # List of Company Identifier Codes for GAN cubes [0x0001, 0xFF01]
-GAN_CIC_LIST: List[int] = [(i << 8) | 0x01 for i in range(256)]
+GAN_CIC_LIST: range = range(0x0001, 0x10000, 0x0100)
 
 # Encryption keys for different GAN cube models
 GAN_ENCRYPTION_KEYS: List[Dict[str, List[int]]] = [
@@ -71,7 +71,7 @@ def extract_mac_from_manufacturer_data(manufacturer_data: Dict[int, bytes]) -> s
     
     if mac_bytes:
         # Format as MAC address string
-        return ":".join(f"{byte:02X}" for byte in mac_bytes)
+        return bytes(mac_bytes).hex(":").upper()
     
     return ""
 
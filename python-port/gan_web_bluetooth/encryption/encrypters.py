@@ -49,6 +49,19 @@ class GanGen2CubeEncrypter:
         self._key = bytes(self._key)
         self._iv = bytes(self._iv)
         self._backend = default_backend()
+        
+        # Each chunk is a single CBC block under the fixed IV, i.e. one raw
+        # AES block op plus an IV xor. ECB contexts carry no chaining state,
+        # so one pair is keyed once here and reused for every packet instead
+        # of building a new Cipher (and key schedule) per chunk.
+        self._iv_int = int.from_bytes(self._iv, 'big')
+        block_cipher = Cipher(
+            algorithms.AES(self._key),
+            modes.ECB(),
+            backend=self._backend
+        )
+        self._block_encryptor = block_cipher.encryptor()
+        self._block_decryptor = block_cipher.decryptor()
     
     def _encrypt_chunk(self, data: bytearray, offset: int) -> None:
         """
@@ -58,15 +71,11 @@ class GanGen2CubeEncrypter:
             data: Buffer to encrypt in-place
             offset: Starting offset for 16-byte chunk
         """
-        cipher = Cipher(
-            algorithms.AES(self._key),
-            modes.CBC(self._iv),
-            backend=self._backend
-        )
-        encryptor = cipher.encryptor()
-        chunk = data[offset:offset + 16]
-        encrypted = encryptor.update(chunk) + encryptor.finalize()
-        data[offset:offset + 16] = encrypted
+        # Write the result back in-place through a zero-copy window
+        with memoryview(data) as view:
+            chunk = view[offset:offset + 16]
+            block = int.from_bytes(chunk, 'big') ^ self._iv_int
+            chunk[:] = self._block_encryptor.update(block.to_bytes(16, 'big'))
     
     def _decrypt_chunk(self, data: bytearray, offset: int) -> None:
         """
@@ -76,15 +85,11 @@ class GanGen2CubeEncrypter:
             data: Buffer to decrypt in-place
             offset: Starting offset for 16-byte chunk
         """
-        cipher = Cipher(
-            algorithms.AES(self._key),
-            modes.CBC(self._iv),
-            backend=self._backend
-        )
-        decryptor = cipher.decryptor()
-        chunk = data[offset:offset + 16]
-        decrypted = decryptor.update(chunk) + decryptor.finalize()
-        data[offset:offset + 16] = decrypted
+        # Feed the cipher a zero-copy window and write the result back in-place
+        with memoryview(data) as view:
+            chunk = view[offset:offset + 16]
+            block = int.from_bytes(self._block_decryptor.update(chunk), 'big')
+            chunk[:] = (block ^ self._iv_int).to_bytes(16, 'big')
     
     def encrypt(self, data: bytes) -> bytes:
         """
@@ -116,7 +121,7 @@ class GanGen2CubeEncrypter:
         
         return bytes(result)
     
-    def decrypt(self, data: bytes) -> bytes:
+    def decrypt(self, data: bytes) -> bytearray:
         """
         Decrypt data using GAN Gen2 scheme.
         
@@ -126,7 +131,8 @@ class GanGen2CubeEncrypter:
             data: Data to decrypt (must be at least 16 bytes)
         
         Returns:
-            Decrypted data
+            Decrypted data, as the working buffer itself; decoders only read
+            it, so it is not copied again into an immutable bytes object
         
         Raises:
             ValueError: If data is less than 16 bytes
@@ -143,16 +149,9 @@ class GanGen2CubeEncrypter:
         # Decrypt 16-byte chunk aligned to message start
         self._decrypt_chunk(result, 0)
         
-        return bytes(result)
-
-
-class GanGen3CubeEncrypter(GanGen2CubeEncrypter):
-    """Implementation for encryption scheme used in the GAN Gen3 cubes."""
-    # Gen3 uses the same encryption as Gen2
-    pass
+        return result
 
 
-class GanGen4CubeEncrypter(GanGen2CubeEncrypter):
-    """Implementation for encryption scheme used in the GAN Gen4 cubes."""
-    # Gen4 also uses the same encryption as Gen2
-    pass
+# Gen3 and Gen4 cubes use the same encryption scheme as Gen2
+GanGen3CubeEncrypter = GanGen2CubeEncrypter
+GanGen4CubeEncrypter = GanGen2CubeEncrypter
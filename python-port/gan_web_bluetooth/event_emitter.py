@@ -22,10 +22,16 @@ except ImportError:
             
             def emit(self, event: str, *args, **kwargs):
                 """Emit event, handling both sync and async handlers."""
-                if event in self._events:
+                registered = self._events.get(event)
+                if registered:
                     # _events[event] is an OrderedDict in pyee, not a list
-                    # Get handlers safely whether it's OrderedDict or list
-                    handlers = list(self._events[event].keys()) if hasattr(self._events[event], 'keys') else list(self._events[event])
+                    # Get handlers safely whether it's OrderedDict or list.
+                    # A lone listener (the common case) is called without
+                    # snapshotting the registry.
+                    if len(registered) == 1:
+                        handlers = (next(iter(registered)),)
+                    else:
+                        handlers = list(registered.keys()) if hasattr(registered, 'keys') else list(registered)
                     for handler in handlers:
                         try:
                             if asyncio.iscoroutinefunction(handler):
@@ -48,7 +54,12 @@ except ImportError:
             
             def on(self, event: str, handler: Callable):
                 """Register event handler."""
-                self._events[event].append(handler)
+                # pyee keys listeners by handler, so registering the same
+                # one twice is a no-op there; match that rather than calling
+                # it once per duplicate registration on every emit
+                handlers = self._events[event]
+                if handler not in handlers:
+                    handlers.append(handler)
             
             def off(self, event: str, handler: Callable = None):
                 """Unregister event handler."""
@@ -68,8 +79,9 @@ except ImportError:
             
             def emit(self, event: str, *args, **kwargs):
                 """Emit event to all registered handlers."""
-                if event in self._events:
-                    for handler in self._events[event][:]:  # Copy to avoid modification during iteration
+                handlers = self._events.get(event)
+                if handlers:
+                    for handler in tuple(handlers):  # Copy to avoid modification during iteration
                         try:
                             if asyncio.iscoroutinefunction(handler):
                                 # Schedule async handler
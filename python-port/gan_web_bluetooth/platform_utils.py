@@ -3,9 +3,14 @@
 import sys
 import platform
 import subprocess
+from functools import lru_cache
 from typing import Optional
 
+# The host OS cannot change while the process runs, so probe it once
+_SYSTEM = platform.system()
 
+
+@lru_cache(maxsize=None)
 def is_wsl() -> bool:
     """Check if running in Windows Subsystem for Linux."""
     try:
@@ -21,7 +26,7 @@ def is_bluetooth_available() -> bool:
         return False
     
     # Check if BlueZ is available on Linux
-    if platform.system() == 'Linux':
+    if _SYSTEM == 'Linux':
         try:
             result = subprocess.run(['hciconfig'], capture_output=True, text=True)
             return result.returncode == 0
@@ -35,7 +40,7 @@ def is_bluetooth_available() -> bool:
 def get_platform_info() -> dict:
     """Get platform information for debugging."""
     return {
-        'system': platform.system(),
+        'system': _SYSTEM,
         'release': platform.release(),
         'version': platform.version(),
         'machine': platform.machine(),
@@ -67,7 +72,7 @@ def print_bluetooth_help():
         print("\n4. 💻 Use a native Linux machine:")
         print("   - Run on a real Linux system with Bluetooth")
         
-    elif platform.system() == 'Linux':
+    elif _SYSTEM == 'Linux':
         print("🐧 Linux Detected")
         print("\nTo enable Bluetooth on Linux:")
         print("1. Install BlueZ: sudo apt install bluez")
@@ -76,12 +81,12 @@ def print_bluetooth_help():
         print("4. Add user to bluetooth group: sudo usermod -a -G bluetooth $USER")
         print("5. Restart your session or run: newgrp bluetooth")
         
-    elif platform.system() == 'Darwin':
+    elif _SYSTEM == 'Darwin':
         print("🍎 macOS Detected")
         print("\nBluetooth should work out of the box on macOS.")
         print("Make sure Bluetooth is enabled in System Preferences.")
         
-    elif platform.system() == 'Windows':
+    elif _SYSTEM == 'Windows':
         print("🪟 Windows Detected")
         print("\nBluetooth should work with the winrt backend.")
         print("Make sure Bluetooth is enabled in Windows Settings.")
@@ -5,7 +5,17 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Callable
 from enum import Enum
 import asyncio
-from ..utils import Quaternion
+import numpy as np
+from ..utils import Quaternion, DATACLASS_SLOTS
+
+
+# Move notation indexed by face + 6 * direction (0-CW, 1-CCW)
+_MOVE_TABLE = ('U', 'R', 'F', 'D', 'L', 'B', "U'", "R'", "F'", "D'", "L'", "B'")
+
+
+def _passthrough(data: bytes) -> bytes:
+    """Return data unchanged, used when no encrypter is configured."""
+    return data
 
 
 class CommandType(Enum):
@@ -16,13 +26,13 @@ class CommandType(Enum):
     REQUEST_RESET = "REQUEST_RESET"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeCommand:
     """Command message to send to cube."""
     type: CommandType
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeMove:
     """Representation of GAN Smart Cube move."""
     face: int  # 0-U, 1-R, 2-F, 3-D, 4-L, 5-B
@@ -32,7 +42,7 @@ class GanCubeMove:
     cube_timestamp: Optional[float]  # Cube internal timestamp
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeMoveEvent:
     """Move event from cube."""
     serial: int  # 0-255, circular counter
@@ -44,16 +54,25 @@ class GanCubeMoveEvent:
     type: str = "MOVE"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeState:
     """Representation of GAN Smart Cube facelets state."""
-    CP: List[int]  # Corner Permutation: 8 elements, 0-7
-    CO: List[int]  # Corner Orientation: 8 elements, 0-2
-    EP: List[int]  # Edge Permutation: 12 elements, 0-11
-    EO: List[int]  # Edge Orientation: 12 elements, 0-1
+    CP: np.ndarray  # Corner Permutation: 8 elements (uint8), 0-7
+    CO: np.ndarray  # Corner Orientation: 8 elements (uint8), 0-2
+    EP: np.ndarray  # Edge Permutation: 12 elements (uint8), 0-11
+    EO: np.ndarray  # Edge Orientation: 12 elements (uint8), 0-1
+    
+    def to_lists(self) -> Dict[str, List[int]]:
+        """Convert state arrays to plain lists for JSON serialization."""
+        return {
+            'cp': self.CP.tolist(),
+            'co': self.CO.tolist(),
+            'ep': self.EP.tolist(),
+            'eo': self.EO.tolist()
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeFaceletsEvent:
     """Facelets event from cube."""
     serial: int  # 0-255, circular counter
@@ -62,7 +81,7 @@ class GanCubeFaceletsEvent:
     type: str = "FACELETS"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeAngularVelocity:
     """Angular velocity by axes."""
     x: float
@@ -70,7 +89,7 @@ class GanCubeAngularVelocity:
     z: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeOrientationEvent:
     """Orientation event from cube."""
     quaternion: Quaternion
@@ -80,14 +99,14 @@ class GanCubeOrientationEvent:
     cube_timestamp: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeBatteryEvent:
     """Battery event from cube."""
     percent: int  # 0-100
     type: str = "BATTERY"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanCubeHardwareEvent:
     """Hardware information event."""
     model: str
@@ -114,6 +133,12 @@ class GanCubeProtocol(ABC):
             encrypter: Encryption implementation for this protocol
         """
         self._encrypter = encrypter
+        # Bind the cipher methods directly so the per-packet path has no branch
+        if encrypter is not None:
+            self._encrypt = encrypter.encrypt
+            self._decrypt = encrypter.decrypt
+        else:
+            self._encrypt = self._decrypt = _passthrough
         self._last_serial = -1
         self._state = None
         self._orientation_buffer = []
@@ -156,18 +181,6 @@ class GanCubeProtocol(ABC):
         pass
     
     
-    def _encrypt(self, data: bytes) -> bytes:
-        """Encrypt data if encrypter is available."""
-        if self._encrypter:
-            return self._encrypter.encrypt(data)
-        return data
-    
-    def _decrypt(self, data: bytes) -> bytes:
-        """Decrypt data if encrypter is available."""
-        if self._encrypter:
-            return self._encrypter.decrypt(data)
-        return data
-    
     @property
     def encrypter(self):
         """Get the encrypter instance."""
@@ -185,10 +198,4 @@ class GanCubeProtocol(ABC):
         Returns:
             Move string like "R" or "U'"
         """
-        faces = ['U', 'R', 'F', 'D', 'L', 'B']
-        if face < 0 or face >= len(faces):
-            return 'X'
-        move = faces[face]
-        if direction == 1:
-            move += "'"
-        return move
\ No newline at end of file
+        return _MOVE_TABLE[face + 6 * direction] if 0 <= face < 6 else 'X'
\ No newline at end of file
@@ -1,28 +1,79 @@
 """GAN Gen2 protocol implementation."""
 
 import struct
+import numpy as np
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
 
 from .base import (
     GanCubeProtocol, GanCubeCommand, CommandType,
     GanCubeMoveEvent, GanCubeFaceletsEvent, GanCubeState,
     GanCubeOrientationEvent, GanCubeBatteryEvent, GanCubeHardwareEvent,
-    GanCubeAngularVelocity
+    GanCubeAngularVelocity, _MOVE_TABLE
 )
 from ..utils import (
     now, to_kociemba_facelets, smooth_orientation_data,
-    cube_timestamp_linear_fit, Quaternion
+    cube_timestamp_linear_fit, Quaternion, OrientationBuffer, njit, HAS_NUMBA
 )
 
 
+# Gyro quaternion: four contiguous 16-bit sign-magnitude fields (w, x, y, z)
+# starting at bit 4, unpacked once realigned to a byte boundary
+_GYRO_QUATERNION = struct.Struct('>4H')
+
+# Facelets fields are read as four packed words (7x3-bit CP, 7x2-bit CO,
+# 11x4-bit EP, 11x1-bit EO) and split with these per-element shifts
+_FACELETS_CP_SHIFTS = np.arange(18, -1, -3, dtype=np.int64)
+_FACELETS_CO_SHIFTS = np.arange(12, -1, -2, dtype=np.int64)
+_FACELETS_EP_SHIFTS = np.arange(40, -1, -4, dtype=np.int64)
+_FACELETS_EO_SHIFTS = np.arange(10, -1, -1, dtype=np.int64)
+
+@njit(cache=True, fastmath=True)
+def _angular_velocity_kernel(prev: np.ndarray, curr: np.ndarray, dt: float) -> np.ndarray:
+    """Finite-difference x/y/z rate between two (x, y, z, w) gyro samples."""
+    return (curr[:3] - prev[:3]) / dt
+
+
+if HAS_NUMBA:
+    # Compile on import so the first gyro packet doesn't pay the JIT cost
+    _angular_velocity_kernel(np.zeros(4), np.ones(4), 1.0)
+
+# Plain (unencrypted) 20-byte Gen2 command messages
+_COMMAND_MESSAGES = {
+    CommandType.REQUEST_FACELETS: bytes([0x04]) + bytes(19),
+    CommandType.REQUEST_HARDWARE: bytes([0x05]) + bytes(19),
+    CommandType.REQUEST_BATTERY: bytes([0x09]) + bytes(19),
+    CommandType.REQUEST_RESET: bytes([
+        0x0A, 0x05, 0x39, 0x77, 0x00, 0x00, 0x01, 0x23,
+        0x45, 0x67, 0x89, 0xAB, 0x00, 0x00, 0x00, 0x00,
+        0x00, 0x00, 0x00, 0x00
+    ]),
+}
+
+
 class ProtocolMessageView:
     """Helper class for bit-level message parsing."""
     
+    __slots__ = ('data', '_w', '_nb')
+    
     def __init__(self, data: bytes):
+        self.reset(data)
+    
+    def reset(self, data: bytes) -> 'ProtocolMessageView':
+        """
+        Point the view at a new message so one instance can be reused.
+        
+        Args:
+            data: Decrypted message bytes
+        
+        Returns:
+            This view
+        """
         self.data = data
-        # Convert bytes to bit string like in TypeScript implementation
-        self.bits = ''.join(f'{byte:08b}' for byte in data)
+        # Hold the whole message as one big-endian integer so fields are
+        # extracted with a shift and a mask instead of bit-string slicing
+        self._w = int.from_bytes(data, 'big')
+        self._nb = len(data) << 3
+        return self
     
     def get_bit_word(self, bit_offset: int, bit_length: int, little_endian: bool = False) -> int:
         """
@@ -36,35 +87,21 @@ class ProtocolMessageView:
         Returns:
             Extracted value as integer
         """
-        if bit_length <= 8:
-            # Simple case: extract from bit string
-            bit_slice = self.bits[bit_offset:bit_offset + bit_length]
-            return int(bit_slice, 2) if bit_slice else 0
-        elif bit_length in (16, 32):
-            # Multi-byte case: extract byte by byte then combine
-            num_bytes = bit_length // 8
-            bytes_data = bytearray()
-            
-            for i in range(num_bytes):
-                byte_start = bit_offset + (8 * i)
-                byte_end = byte_start + 8
-                byte_bits = self.bits[byte_start:byte_end]
-                if byte_bits:
-                    bytes_data.append(int(byte_bits, 2))
-                else:
-                    bytes_data.append(0)
-            
-            # Convert to integer with proper endianness
-            if bit_length == 16:
-                import struct
-                return struct.unpack('<H' if little_endian else '>H', bytes_data)[0]
-            else:  # 32-bit
-                import struct
-                return struct.unpack('<I' if little_endian else '>I', bytes_data)[0]
+        shift = self._nb - bit_offset - bit_length
+        if shift >= 0:
+            value = (self._w >> shift) & ((1 << bit_length) - 1)
         else:
-            # Fallback for other sizes
-            bit_slice = self.bits[bit_offset:bit_offset + bit_length]
-            return int(bit_slice, 2) if bit_slice else 0
+            # Field runs past the end of the message, keep the bits that exist
+            value = self._w & ((1 << max(self._nb - bit_offset, 0)) - 1)
+        
+        if little_endian:
+            # Byte-swap in place of a struct round-trip
+            if bit_length == 16:
+                value = ((value & 0xFF) << 8) | (value >> 8)
+            elif bit_length == 32:
+                value = (((value & 0xFF) << 24) | (((value >> 8) & 0xFF) << 16)
+                         | (((value >> 16) & 0xFF) << 8) | (value >> 24))
+        return value
 
 
 class GanGen2Protocol(GanCubeProtocol):
@@ -79,21 +116,40 @@ class GanGen2Protocol(GanCubeProtocol):
     - MoYu AI 2023
     """
     
+    GYRO_BUFFER_SIZE = 5
+    GYRO_RATE_LIMIT_MS = 1  # Maximum responsiveness for gaming controller
+    MAX_TIMESTAMP_HISTORY = 20
+    
     def __init__(self, encrypter=None):
         super().__init__(encrypter)
+        # Encrypted command frames; the cipher is deterministic per connection
+        self._encoded_commands = {}
         self.last_serial = -1
         self.last_move_timestamp = 0
         self.cube_timestamp = 0
         
-        # Gyroscope smoothing
-        self.gyro_buffer = []
-        self.GYRO_BUFFER_SIZE = 5
-        self.GYRO_RATE_LIMIT_MS = 1  # Maximum responsiveness for gaming controller
+        # Gyroscope smoothing: ring buffer of recent orientation samples
+        self.gyro_buffer = OrientationBuffer(self.GYRO_BUFFER_SIZE)
         self.last_gyro_emit = 0
         
         # Timestamp synchronization
-        self.gyro_timestamp_history = []
-        self.MAX_TIMESTAMP_HISTORY = 20
+        # Ring buffer of (cube_time, host_time) rows; the fit is order-independent
+        self.gyro_timestamp_history = np.zeros((self.MAX_TIMESTAMP_HISTORY, 2), dtype=np.float64)
+        self._sync_head = 0
+        self._sync_len = 0
+        
+        # Reusable message view; decoding is single-consumer per connection
+        self._view = ProtocolMessageView(b'')
+        
+        # Event type (first nibble) -> handler
+        self._dispatch = {
+            0x01: self._handle_gyro_event,      # GYRO/ORIENTATION
+            0x02: self._handle_move_event,      # MOVE
+            0x03: self._handle_facelets_event,  # FACELETS (some cubes use 0x03 instead of 0x04)
+            0x04: self._handle_facelets_event,  # FACELETS
+            0x05: self._handle_hardware_event,  # HARDWARE
+            0x09: self._handle_battery_event,   # BATTERY
+        }
     
     def get_protocol_name(self) -> str:
         return "GAN_GEN2"
@@ -103,74 +159,50 @@ class GanGen2Protocol(GanCubeProtocol):
     
     def encode_command(self, command: GanCubeCommand) -> bytes:
         """Encode command for Gen2 protocol."""
-        msg = bytearray(20)
-        
-        if command.type == CommandType.REQUEST_FACELETS:
-            msg[0] = 0x04
-        elif command.type == CommandType.REQUEST_HARDWARE:
-            msg[0] = 0x05
-        elif command.type == CommandType.REQUEST_BATTERY:
-            msg[0] = 0x09
-        elif command.type == CommandType.REQUEST_RESET:
-            reset_data = bytes([
-                0x0A, 0x05, 0x39, 0x77, 0x00, 0x00, 0x01, 0x23,
-                0x45, 0x67, 0x89, 0xAB, 0x00, 0x00, 0x00, 0x00,
-                0x00, 0x00, 0x00, 0x00
-            ])
-            msg[:len(reset_data)] = reset_data
-        else:
-            return None
-        
-        # Encrypt if encrypter available
-        return self._encrypt(bytes(msg))
+        encoded = self._encoded_commands.get(command.type)
+        if encoded is None:
+            msg = _COMMAND_MESSAGES.get(command.type)
+            if msg is None:
+                return None
+            
+            # Encrypt if encrypter available
+            encoded = self._encoded_commands[command.type] = bytes(self._encrypt(msg))
+        return encoded
     
     def decode_event(self, data: bytes) -> Optional[List[Any]]:
         """Decode event from Gen2 protocol."""
         # Decrypt if encrypter available
         data = self._decrypt(data)
+        if not data:
+            return None
         
-        timestamp = now()
-        events = []
-        msg = ProtocolMessageView(data)
-        event_type = msg.get_bit_word(0, 4)
-        
-        if event_type == 0x01:  # GYRO/ORIENTATION
-            events.extend(self._handle_gyro_event(msg, timestamp))
-        elif event_type == 0x02:  # MOVE
-            events.extend(self._handle_move_event(msg, timestamp))
-        elif event_type == 0x03:  # FACELETS (some cubes use 0x03 instead of 0x04)
-            events.extend(self._handle_facelets_event(msg, timestamp))
-        elif event_type == 0x04:  # FACELETS
-            events.extend(self._handle_facelets_event(msg, timestamp))
-        elif event_type == 0x05:  # HARDWARE
-            events.extend(self._handle_hardware_event(msg, timestamp))
-        elif event_type == 0x09:  # BATTERY
-            events.extend(self._handle_battery_event(msg, timestamp))
-        elif event_type == 0x0D:  # DISCONNECT
-            # Signal disconnect
-            pass
-        
-        return events if events else None
+        # Event type is the high nibble of the first byte; 0x0D (DISCONNECT)
+        # and unknown types have no handler
+        handler = self._dispatch.get(data[0] >> 4)
+        if handler is None:
+            return None
+        
+        return handler(data, now()) or None
     
-    def _handle_gyro_event(self, msg: ProtocolMessageView, timestamp: float) -> List[Any]:
+    def _handle_gyro_event(self, data: bytes, timestamp: float) -> Optional[List[Any]]:
         """Handle gyroscope/orientation event."""
-        # Parse quaternion data
-        qw = msg.get_bit_word(4, 16)
-        qx = msg.get_bit_word(20, 16)
-        qy = msg.get_bit_word(36, 16)
-        qz = msg.get_bit_word(52, 16)
-        
-        # Convert to normalized quaternion
-        quaternion = Quaternion(
-            x=(1 - (qx >> 15) * 2) * (qx & 0x7FFF) / 0x7FFF,
-            y=(1 - (qy >> 15) * 2) * (qy & 0x7FFF) / 0x7FFF,
-            z=(1 - (qz >> 15) * 2) * (qz & 0x7FFF) / 0x7FFF,
-            w=(1 - (qw >> 15) * 2) * (qw & 0x7FFF) / 0x7FFF
-        )
+        # Rate-limited samples are discarded anyway, so skip parsing them
+        if timestamp - self.last_gyro_emit < self.GYRO_RATE_LIMIT_MS:
+            return None
+        
+        # Parse quaternion data (w, x, y, z as 16-bit sign-magnitude values).
+        # The fields span bits 4-67, so drop the event-type nibble from the
+        # first 9 bytes and unpack the 8 realigned bytes with one struct call.
+        packed = (int.from_bytes(data[:9], 'big') >> 4) & 0xFFFFFFFFFFFFFFFF
+        qw, qx, qy, qz = [
+            (raw & 0x7FFF) / (-0x7FFF if raw & 0x8000 else 0x7FFF)
+            for raw in _GYRO_QUATERNION.unpack(packed.to_bytes(8, 'big'))
+        ]
+        quaternion = Quaternion(x=qx, y=qy, z=qz, w=qw)
         
         # Process through smoothing
         event = self._process_gyro_data(quaternion, timestamp)
-        return [event] if event else []
+        return [event] if event else None
     
     def _process_gyro_data(self, quaternion: Quaternion, timestamp: float, 
                           cube_timestamp: Optional[float] = None) -> Optional[GanCubeOrientationEvent]:
@@ -183,21 +215,12 @@ class GanGen2Protocol(GanCubeProtocol):
         if cube_timestamp is not None:
             self._update_timestamp_sync(cube_timestamp, timestamp)
         
-        # Add to buffer
-        self.gyro_buffer.append({
-            'quaternion': quaternion,
-            'timestamp': timestamp
-        })
+        # Add to ring buffer, overwriting the oldest sample when full
+        self.gyro_buffer.append(quaternion, timestamp)
         
-        # Maintain buffer size
-        if len(self.gyro_buffer) > self.GYRO_BUFFER_SIZE:
-            self.gyro_buffer.pop(0)
-        
-        # Apply smoothing
-        smoothed = smooth_orientation_data(
-            self.gyro_buffer,
-            min(3, len(self.gyro_buffer))
-        )
+        # Apply smoothing over the most recent samples in chronological order
+        recent, _ = self.gyro_buffer.last(3)
+        smoothed = smooth_orientation_data(recent, 3)
         
         if smoothed:
             self.last_gyro_emit = timestamp
@@ -215,21 +238,20 @@ class GanGen2Protocol(GanCubeProtocol):
     
     def _update_timestamp_sync(self, cube_time: float, host_time: float):
         """Update timestamp synchronization data."""
-        self.gyro_timestamp_history.append({
-            'cube_time': cube_time,
-            'host_time': host_time
-        })
-        
-        # Maintain history size
-        if len(self.gyro_timestamp_history) > self.MAX_TIMESTAMP_HISTORY:
-            self.gyro_timestamp_history.pop(0)
+        # Overwrite the oldest point once the history is full
+        row = self.gyro_timestamp_history[self._sync_head]
+        row[0] = cube_time
+        row[1] = host_time
+        self._sync_head = (self._sync_head + 1) % self.MAX_TIMESTAMP_HISTORY
+        if self._sync_len < self.MAX_TIMESTAMP_HISTORY:
+            self._sync_len += 1
     
     def _get_synchronized_timestamp(self, cube_timestamp: float) -> float:
         """Get synchronized timestamp using linear regression."""
-        if len(self.gyro_timestamp_history) < 2:
+        if self._sync_len < 2:
             return now()
         
-        fit = cube_timestamp_linear_fit(self.gyro_timestamp_history)
+        fit = cube_timestamp_linear_fit(self.gyro_timestamp_history[:self._sync_len])
         return round(fit.slope * cube_timestamp + fit.intercept)
     
     def _calculate_angular_velocity(self) -> Optional[GanCubeAngularVelocity]:
@@ -237,89 +259,95 @@ class GanGen2Protocol(GanCubeProtocol):
         if len(self.gyro_buffer) < 2:
             return None
         
-        recent = self.gyro_buffer[-2:]
-        dt = (recent[1]['timestamp'] - recent[0]['timestamp']) / 1000  # to seconds
+        (prev, curr), (prev_time, curr_time) = self.gyro_buffer.last(2)
+        dt = (curr_time - prev_time) / 1000  # to seconds
         
         if dt <= 0:
             return None
         
-        q1 = recent[0]['quaternion']
-        q2 = recent[1]['quaternion']
-        
-        return GanCubeAngularVelocity(
-            x=(q2.x - q1.x) / dt,
-            y=(q2.y - q1.y) / dt,
-            z=(q2.z - q1.z) / dt
-        )
+        if HAS_NUMBA:
+            dx, dy, dz = _angular_velocity_kernel(prev, curr, dt).tolist()
+        else:
+            # Three plain subtractions beat numpy dispatch for one sample
+            px, py, pz, _ = prev.tolist()
+            cx, cy, cz, _ = curr.tolist()
+            dt = float(dt)
+            dx, dy, dz = (cx - px) / dt, (cy - py) / dt, (cz - pz) / dt
+        return GanCubeAngularVelocity(x=dx, y=dy, z=dz)
     
-    def _handle_move_event(self, msg: ProtocolMessageView, timestamp: float) -> List[GanCubeMoveEvent]:
+    def _handle_move_event(self, data: bytes, timestamp: float) -> Optional[List[GanCubeMoveEvent]]:
         """Handle move event."""
-        events = []
-        
         # Only accept moves after first facelets event
         if self.last_serial == -1:
-            return events
+            return None
         
+        msg = self._view.reset(data)
         serial = msg.get_bit_word(4, 8)
         diff = min((serial - self.last_serial) & 0xFF, 7)
         self.last_serial = serial
         
-        if diff > 0:
-            for i in range(diff - 1, -1, -1):
-                face = msg.get_bit_word(12 + 5 * i, 4)
-                direction = msg.get_bit_word(16 + 5 * i, 1)
-                move = self._move_to_string(face, direction)
-                
-                elapsed = msg.get_bit_word(47 + 16 * i, 16)
-                if elapsed == 0:  # Handle timestamp overflow
-                    elapsed = timestamp - self.last_move_timestamp
-                
-                self.cube_timestamp += elapsed
-                
-                events.append(GanCubeMoveEvent(
-                    type="MOVE",
-                    serial=(serial - i) & 0xFF,
-                    face=face,
-                    direction=direction,
-                    move=move,
-                    local_timestamp=timestamp if i == 0 else None,
-                    cube_timestamp=self.cube_timestamp
-                ))
-            
-            self.last_move_timestamp = timestamp
+        # Repeated serial: nothing new to report
+        if diff == 0:
+            return None
         
+        events = []
+        for i in range(diff - 1, -1, -1):
+            face = msg.get_bit_word(12 + 5 * i, 4)
+            direction = msg.get_bit_word(16 + 5 * i, 1)
+            move = self._move_to_string(face, direction)
+            
+            elapsed = msg.get_bit_word(47 + 16 * i, 16)
+            if elapsed == 0:  # Handle timestamp overflow
+                elapsed = timestamp - self.last_move_timestamp
+            
+            self.cube_timestamp += elapsed
+            
+            events.append(GanCubeMoveEvent(
+                type="MOVE",
+                serial=(serial - i) & 0xFF,
+                face=face,
+                direction=direction,
+                move=move,
+                local_timestamp=timestamp if i == 0 else None,
+                cube_timestamp=self.cube_timestamp
+            ))
+        
+        self.last_move_timestamp = timestamp
         return events
     
-    def _handle_facelets_event(self, msg: ProtocolMessageView, timestamp: float) -> List[GanCubeFaceletsEvent]:
+    def _handle_facelets_event(self, data: bytes, timestamp: float) -> List[GanCubeFaceletsEvent]:
         """Handle facelets state event."""
+        msg = self._view.reset(data)
         serial = msg.get_bit_word(4, 8)
         
         if self.last_serial == -1:
             self.last_serial = serial
         
         # Parse corner/edge permutation and orientation
-        cp = []
-        co = []
-        ep = []
-        eo = []
+        cp = np.zeros(8, dtype=np.uint8)
+        co = np.zeros(8, dtype=np.uint8)
+        ep = np.zeros(12, dtype=np.uint8)
+        eo = np.zeros(12, dtype=np.uint8)
         
         # Corners
-        for i in range(7):
-            cp.append(msg.get_bit_word(12 + i * 3, 3))
-            co.append(msg.get_bit_word(33 + i * 2, 2))
+        cp_word = msg.get_bit_word(12, 21)
+        co_word = msg.get_bit_word(33, 14)
+        cp[:7] = (cp_word >> _FACELETS_CP_SHIFTS) & 0x7
+        co[:7] = (co_word >> _FACELETS_CO_SHIFTS) & 0x3
         
-        # Calculate parity for last corner
-        cp.append((28 - sum(cp)) % 8)
-        co.append((3 - (sum(co) % 3)) % 3)
+        # Calculate parity for last corner (array sums run in C)
+        cp[7] = (28 - int(cp.sum())) & 7
+        co[7] = -int(co.sum()) % 3
         
         # Edges
-        for i in range(11):
-            ep.append(msg.get_bit_word(47 + i * 4, 4))
-            eo.append(msg.get_bit_word(91 + i, 1))
+        ep_word = msg.get_bit_word(47, 44)
+        eo_word = msg.get_bit_word(91, 11)
+        ep[:11] = (ep_word >> _FACELETS_EP_SHIFTS) & 0xF
+        eo[:11] = (eo_word >> _FACELETS_EO_SHIFTS) & 0x1
         
         # Calculate parity for last edge
-        ep.append((66 - sum(ep)) % 12)
-        eo.append((2 - (sum(eo) % 2)) % 2)
+        ep[11] = (66 - int(ep.sum())) % 12
+        eo[11] = int(eo.sum()) & 1
         
         state = GanCubeState(CP=cp, CO=co, EP=ep, EO=eo)
         facelets = to_kociemba_facelets(cp, co, ep, eo)
@@ -331,20 +359,17 @@ class GanGen2Protocol(GanCubeProtocol):
             state=state
         )]
     
-    def _handle_hardware_event(self, msg: ProtocolMessageView, timestamp: float) -> List[GanCubeHardwareEvent]:
+    def _handle_hardware_event(self, data: bytes, timestamp: float) -> List[GanCubeHardwareEvent]:
         """Handle hardware information event."""
+        msg = self._view.reset(data)
         hw_major = msg.get_bit_word(8, 8)
         hw_minor = msg.get_bit_word(16, 8)
         sw_major = msg.get_bit_word(24, 8)
         sw_minor = msg.get_bit_word(32, 8)
         gyro_supported = msg.get_bit_word(104, 1)
         
-        # Parse hardware name
-        hardware_name = ''
-        for i in range(8):
-            char_code = msg.get_bit_word(i * 8 + 40, 8)
-            if char_code:
-                hardware_name += chr(char_code)
+        # Parse hardware name (byte-aligned at bytes 5-12, NUL padded)
+        hardware_name = data[5:13].replace(b'\x00', b'').decode('latin-1')
         
         return [GanCubeHardwareEvent(
             type="HARDWARE",
@@ -353,9 +378,9 @@ class GanGen2Protocol(GanCubeProtocol):
             protocol="GEN2"
         )]
     
-    def _handle_battery_event(self, msg: ProtocolMessageView, timestamp: float) -> List[GanCubeBatteryEvent]:
+    def _handle_battery_event(self, data: bytes, timestamp: float) -> List[GanCubeBatteryEvent]:
         """Handle battery level event."""
-        battery_level = msg.get_bit_word(8, 8)
+        battery_level = data[1]
         
         return [GanCubeBatteryEvent(
             type="BATTERY",
@@ -364,20 +389,4 @@ class GanGen2Protocol(GanCubeProtocol):
     
     def _move_to_string(self, face: int, direction: int) -> str:
         """Convert face and direction to move notation."""
-        face_chars = "URFDLB"
-        if 0 <= face < len(face_chars):
-            face_char = face_chars[face]
-            return face_char + "'" if direction == 1 else face_char
-        return "?"
-    
-    def _encrypt(self, data: bytes) -> bytes:
-        """Encrypt data using encrypter if available."""
-        if self.encrypter:
-            return self.encrypter.encrypt(data)
-        return data
-    
-    def _decrypt(self, data: bytes) -> bytes:
-        """Decrypt data using encrypter if available."""
-        if self.encrypter:
-            return self.encrypter.decrypt(data)
-        return data
\ No newline at end of file
+        return _MOVE_TABLE[face + 6 * direction] if 0 <= face < 6 else "?"
@@ -1,6 +1,7 @@
 """GAN Smart Cube implementation using bleak."""
 
 import asyncio
+import logging
 import struct
 from typing import Optional, Callable, List, Dict, Any, Union
 from dataclasses import dataclass
@@ -8,9 +9,11 @@ try:
     from bleak import BleakClient, BleakScanner, BLEDevice
     from bleak.backends.device import BLEDevice
     from bleak.backends.scanner import AdvertisementData
+    from bleak.exc import BleakError
 except ImportError:
     # Fallback for systems without proper Bluetooth support
     BleakClient = BleakScanner = BLEDevice = AdvertisementData = None
+    BleakError = OSError
 from .event_emitter import EventEmitter
 
 from . import definitions as defs
@@ -27,6 +30,15 @@ from .utils import now
 from .platform_utils import is_bluetooth_available, MockBleakScanner, MockBleakClient, print_bluetooth_help
 
 
+_LOG = logging.getLogger(__name__)
+
+# Failures tolerated while tearing down a connection
+_TEARDOWN_ERRORS = (BleakError, OSError, asyncio.CancelledError)
+
+# Advertised name prefixes of supported smart cubes
+_GAN_CUBE_PREFIXES = ('GAN', 'MG', 'AiCube')
+
+
 class GanSmartCube:
     """
     GAN Smart Cube connection and control.
@@ -54,7 +66,11 @@ class GanSmartCube:
         await cube.disconnect()
     """
     
-    def __init__(self, mac_address_provider: Optional[Callable] = None):
+    # Default orientation throttle: emitted at most this often (seconds)
+    ORIENTATION_FLUSH_INTERVAL = 1 / 30
+    
+    def __init__(self, mac_address_provider: Optional[Callable] = None,
+                 orientation_flush_interval: Optional[float] = ORIENTATION_FLUSH_INTERVAL):
         """
         Initialize GAN Smart Cube.
         
@@ -62,6 +78,9 @@ class GanSmartCube:
             mac_address_provider: Optional function to provide MAC address
                                  for encryption. If None, will try to extract
                                  from advertisement data.
+            orientation_flush_interval: Minimum seconds between 'orientation'
+                                 events; samples in between are coalesced to
+                                 the newest. None emits every sample immediately.
         """
         self._client: Optional[BleakClient] = None
         self._protocol: Optional[GanCubeProtocol] = None
@@ -71,6 +90,31 @@ class GanSmartCube:
         self._command_char = None
         self._state_char = None
         self._device_info = {}
+        
+        # Bound once in connect so hot paths skip the attribute chains
+        self._write: Optional[Callable] = None
+        self._encode: Optional[Callable] = None
+        self._decode: Optional[Callable] = None
+        self._write_response = True
+        
+        # Raw notification hand-off from the BLE callback to the decoder task
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rx_queue: Optional[asyncio.Queue] = None
+        self._rx_task: Optional[asyncio.Task] = None
+        
+        # Orientation throttling: the newest sample held back inside the
+        # current window, and the timer that closes that window
+        self._orientation_interval = orientation_flush_interval
+        self._pending_orientation: Optional[GanCubeOrientationEvent] = None
+        self._orientation_flush: Optional[asyncio.TimerHandle] = None
+        
+        # Event class -> emitted event name (hardware and orientation
+        # events are handled separately)
+        self._event_dispatch = {
+            GanCubeMoveEvent: 'move',
+            GanCubeFaceletsEvent: 'facelets',
+            GanCubeBatteryEvent: 'battery',
+        }
     
     def on(self, event: str, handler: Callable):
         """
@@ -79,7 +123,7 @@ class GanSmartCube:
         Events:
         - 'move': Cube move detected (GanCubeMoveEvent)
         - 'facelets': Facelets state update (GanCubeFaceletsEvent)
-        - 'orientation': Orientation update (GanCubeOrientationEvent)
+        - 'orientation': Orientation update, throttled per orientation_flush_interval (GanCubeOrientationEvent)
         - 'battery': Battery level update (GanCubeBatteryEvent)
         - 'hardware': Hardware info received (GanCubeHardwareEvent)
         - 'connected': Connected to cube
@@ -142,35 +186,33 @@ class GanSmartCube:
         
         # If still no MAC, try using the device address as fallback
         if not mac_address:
-            print(f"Warning: No MAC address found, using device address as fallback")
+            _LOG.warning("No MAC address found, using device address as fallback")
             mac_address = device_address
         
         # Create encryption salt from MAC (reversed)
-        mac_bytes = [int(x, 16) for x in mac_address.split(':')]
-        salt = bytes(reversed(mac_bytes))
+        salt = bytes.fromhex(mac_address.replace(':', ''))[::-1]
         
         # Connect to device
-        print(f"Connecting to device at {device_address}...")
+        _LOG.debug("Connecting to device at %s...", device_address)
         self._client = BleakClient(device_address)
         await self._client.connect()
-        print(f"Connected! Device is connected: {self._client.is_connected}")
+        _LOG.debug("Connected! Device is connected: %s", self._client.is_connected)
         
         # Get services and detect protocol
-        print("Discovering services...")
         services = self._client.services
-        service_list = list(services)
-        print(f"Found {len(service_list)} services:")
-        for service in service_list:
-            print(f"  Service: {service.uuid}")
+        if _LOG.isEnabledFor(logging.DEBUG):
+            service_list = list(services)
+            _LOG.debug("Found %d services:", len(service_list))
+            for service in service_list:
+                _LOG.debug("  Service: %s", service.uuid)
         
         # Try to detect and setup protocol
         protocol_found = False
         
         # Check for Gen2 protocol
-        print(f"Looking for Gen2 service: {defs.GAN_GEN2_SERVICE}")
-        if services.get_service(defs.GAN_GEN2_SERVICE):
-            print("✓ Found Gen2 service")
-            service = services.get_service(defs.GAN_GEN2_SERVICE)
+        _LOG.debug("Looking for Gen2 service: %s", defs.GAN_GEN2_SERVICE)
+        if (service := services.get_service(defs.GAN_GEN2_SERVICE)):
+            _LOG.debug("Found Gen2 service")
             self._command_char = service.get_characteristic(defs.GAN_GEN2_COMMAND_CHARACTERISTIC)
             self._state_char = service.get_characteristic(defs.GAN_GEN2_STATE_CHARACTERISTIC)
             
@@ -186,12 +228,11 @@ class GanSmartCube:
             )
             self._protocol = GanGen2Protocol(encrypter)
             protocol_found = True
-            print("✓ Gen2 protocol configured")
+            _LOG.debug("Gen2 protocol configured")
             
         # Check for Gen3 protocol
-        elif services.get_service(defs.GAN_GEN3_SERVICE):
-            print("✓ Found Gen3 service")
-            service = services.get_service(defs.GAN_GEN3_SERVICE)
+        elif (service := services.get_service(defs.GAN_GEN3_SERVICE)):
+            _LOG.debug("Found Gen3 service")
             self._command_char = service.get_characteristic(defs.GAN_GEN3_COMMAND_CHARACTERISTIC)
             self._state_char = service.get_characteristic(defs.GAN_GEN3_STATE_CHARACTERISTIC)
             
@@ -207,9 +248,8 @@ class GanSmartCube:
             protocol_found = True
             
         # Check for Gen4 protocol
-        elif services.get_service(defs.GAN_GEN4_SERVICE):
-            print("✓ Found Gen4 service")
-            service = services.get_service(defs.GAN_GEN4_SERVICE)
+        elif (service := services.get_service(defs.GAN_GEN4_SERVICE)):
+            _LOG.debug("Found Gen4 service")
             self._command_char = service.get_characteristic(defs.GAN_GEN4_COMMAND_CHARACTERISTIC)
             self._state_char = service.get_characteristic(defs.GAN_GEN4_STATE_CHARACTERISTIC)
             
@@ -228,38 +268,93 @@ class GanSmartCube:
             await self._client.disconnect()
             raise RuntimeError("Unsupported cube model or protocol")
         
-        # Subscribe to state notifications
-        await self._client.start_notify(
-            self._state_char,
-            self._handle_state_notification
+        # Resolve the per-command/per-notification callables once
+        self._write = self._client.write_gatt_char
+        self._encode = self._protocol.encode_command
+        self._decode = self._protocol.decode_event
+        
+        # Commands are fire-and-forget; skip the ACK round-trip when allowed
+        self._write_response = not (
+            self._command_char
+            and 'write-without-response' in self._command_char.properties
         )
         
-        self._connected = True
-        self._event_emitter.emit('connected', None)
+        # Start the decoder before notifications can arrive
+        self._loop = asyncio.get_running_loop()
+        self._rx_queue = asyncio.Queue()
+        self._rx_task = asyncio.create_task(self._consume_rx())
         
-        # Request initial hardware info
-        await self.request_hardware_info()
+        try:
+            # Subscribe to state notifications
+            await self._client.start_notify(
+                self._state_char,
+                self._handle_state_notification
+            )
+            
+            self._connected = True
+            self._event_emitter.emit('connected', None)
+            
+            # Request initial hardware info
+            await self.request_hardware_info()
+        except BaseException:
+            # disconnect() skips cleanup until _connected is set, so stop
+            # the decoder and any throttle timer here rather than leak them
+            self._rx_task.cancel()
+            try:
+                await self._rx_task
+            except asyncio.CancelledError:
+                pass
+            if self._orientation_flush:
+                self._orientation_flush.cancel()
+            self._rx_task = None
+            self._rx_queue = None
+            self._orientation_flush = None
+            self._pending_orientation = None
+            
+            # Don't leave a half-set-up link open behind a failed connect
+            self._connected = False
+            try:
+                await self._client.disconnect()
+            except _TEARDOWN_ERRORS:
+                pass
+            raise
     
     async def disconnect(self) -> None:
         """Disconnect from cube."""
         if not self._connected or not self._client:
             return
         
-        try:
-            if self._state_char:
-                await self._client.stop_notify(self._state_char)
-        except:
-            pass
-        
-        try:
-            await self._client.disconnect()
-        except:
-            pass
+        # Overlap the two BLE round-trips; only expected failures are ignored
+        calls = [self._client.disconnect()]
+        if self._state_char:
+            calls.insert(0, self._client.stop_notify(self._state_char))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors = [
+            r for r in results
+            if isinstance(r, BaseException) and not isinstance(r, _TEARDOWN_ERRORS)
+        ]
+        
+        if self._rx_task:
+            self._rx_task.cancel()
+            try:
+                await self._rx_task
+            except asyncio.CancelledError:
+                pass
+        if self._orientation_flush:
+            self._orientation_flush.cancel()
         
         self._connected = False
         self._client = None
         self._protocol = None
+        self._write = self._encode = self._decode = None
+        self._rx_task = None
+        self._rx_queue = None
+        self._orientation_flush = None
+        self._pending_orientation = None
         self._event_emitter.emit('disconnected', None)
+        
+        if errors:
+            raise errors[0]
     
     async def get_state(self) -> Optional[str]:
         """
@@ -271,15 +366,25 @@ class GanSmartCube:
         if not self._connected:
             raise RuntimeError("Not connected to cube")
         
-        # Send request facelets command
-        cmd = GanCubeCommand(type=CommandType.REQUEST_FACELETS)
-        await self._send_command(cmd)
+        # Resolve on the reply itself rather than sleeping a fixed interval
+        reply = asyncio.get_running_loop().create_future()
         
-        # Wait for facelets event (with timeout)
-        # Note: In production, this would use proper event waiting
-        await asyncio.sleep(0.5)
+        def on_facelets(event: GanCubeFaceletsEvent) -> None:
+            if not reply.done():
+                reply.set_result(event.facelets)
         
-        return None  # Placeholder
+        self._event_emitter.on('facelets', on_facelets)
+        try:
+            # Send request facelets command
+            cmd = GanCubeCommand(type=CommandType.REQUEST_FACELETS)
+            await self._send_command(cmd)
+            
+            # Wait for facelets event (with timeout)
+            return await asyncio.wait_for(reply, timeout=0.5)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._event_emitter.remove_listener('facelets', on_facelets)
     
     async def request_battery(self) -> None:
         """Request battery level from cube."""
@@ -322,26 +427,34 @@ class GanSmartCube:
         Returns:
             Tuple of (device, mac_address)
         """
-        print("Scanning for devices...")
-        
-        # First try a general scan to see what's available
-        devices = await BleakScanner.discover(timeout=3.0)
-        
-        print(f"Found {len(devices)} devices:")
-        for device in devices:
-            name = device.name or "Unknown"
-            print(f"  {device.address}: {name}")
-        
-        # Look for GAN cube by name
-        for device in devices:
-            if device.name and any(
-                device.name.startswith(prefix)
-                for prefix in ["GAN", "MG", "AiCube"]
-            ):
-                print(f"Found potential GAN cube: {device.name} at {device.address}")
-                return device, device.address
-        
-        return None, None
+        _LOG.debug("Scanning for devices...")
+        
+        mac_address = None
+        
+        def detection_callback(device: BLEDevice, advertisement_data: AdvertisementData):
+            nonlocal mac_address
+            
+            # Look for GAN cube by name
+            if not (device.name and device.name.startswith(_GAN_CUBE_PREFIXES)):
+                return False
+            
+            # Grab the MAC from the same advertisement to avoid a second scan
+            if advertisement_data.manufacturer_data:
+                mac_address = self._extract_mac_from_manufacturer_data(
+                    advertisement_data.manufacturer_data
+                )
+            return True
+        
+        # Stop as soon as a matching advertisement is seen
+        device = await BleakScanner.find_device_by_filter(
+            detection_callback,
+            timeout=5.0
+        )
+        if not device:
+            return None, None
+        
+        _LOG.debug("Found potential GAN cube: %s at %s", device.name, device.address)
+        return device, mac_address or device.address
     
     async def _get_mac_from_scan(self, device_address: str) -> Optional[str]:
         """
@@ -391,43 +504,105 @@ class GanSmartCube:
                 data = manufacturer_data[cic]
                 if len(data) >= 9:
                     # MAC is in last 6 bytes, reversed
-                    mac_bytes = data[3:9]
-                    mac = ':'.join(f"{b:02X}" for b in reversed(mac_bytes))
-                    return mac
+                    return data[8:2:-1].hex(':').upper()
         return None
     
     async def _send_command(self, command: GanCubeCommand) -> None:
         """Send command to cube."""
-        if not self._protocol or not self._command_char:
+        encode = self._encode
+        if not encode or not self._command_char:
             return
         
-        data = self._protocol.encode_command(command)
+        data = encode(command)
         if data:
-            await self._client.write_gatt_char(self._command_char, data)
+            await self._write(self._command_char, data, response=self._write_response)
     
     def _handle_state_notification(self, sender, data: bytes):
-        """Handle state notification from cube."""
-        if not self._protocol:
+        """
+        Handle state notification from cube.
+        
+        Only copies the payload onto the receive queue so the BLE callback
+        returns immediately; decoding happens in _consume_rx.
+        """
+        if self._loop and self._rx_queue is not None:
+            # bleak may reuse the notification buffer, so take a copy
+            self._loop.call_soon_threadsafe(self._enqueue_rx, bytes(data))
+    
+    def _enqueue_rx(self, data: bytes) -> None:
+        """Queue a raw notification for the decoder."""
+        # Unbounded: a dropped move or facelets packet would desync the cube
+        queue = self._rx_queue
+        if queue is not None:
+            queue.put_nowait(data)
+    
+    async def _consume_rx(self) -> None:
+        """Decode queued notifications and emit the resulting events."""
+        queue = self._rx_queue
+        process = self._process_state_data
+        while True:
+            data = await queue.get()
+            # Drain a burst of notifications in one pass rather than going
+            # back through queue.get() for every packet
+            while True:
+                try:
+                    process(data)
+                except Exception:
+                    # Don't let a bad packet or handler error stop the decoder
+                    _LOG.exception("Notification processing error")
+                if queue.empty():
+                    break
+                data = queue.get_nowait()
+    
+    def _emit_orientation(self, event: GanCubeOrientationEvent) -> None:
+        """Emit an orientation event, throttled to one per flush interval."""
+        if self._orientation_interval is None:
+            self._event_emitter.emit('orientation', event)
+        elif self._orientation_flush is None:
+            # Leading edge: emit now and hold later samples until the window ends
+            self._event_emitter.emit('orientation', event)
+            self._orientation_flush = self._loop.call_later(
+                self._orientation_interval, self._flush_orientation
+            )
+        else:
+            self._pending_orientation = event
+    
+    def _flush_orientation(self) -> None:
+        """Close a throttle window, emitting the newest sample held back in it."""
+        event = self._pending_orientation
+        if event is None:
+            # Idle: no timer runs until the next sample arrives
+            self._orientation_flush = None
+            return
+        self._pending_orientation = None
+        self._event_emitter.emit('orientation', event)
+        self._orientation_flush = self._loop.call_later(
+            self._orientation_interval, self._flush_orientation
+        )
+    
+    def _process_state_data(self, data: bytes) -> None:
+        """Decode a raw state notification and emit its events."""
+        decode = self._decode
+        if not decode:
             return
         
-        events = self._protocol.decode_event(data)
+        events = decode(data)
         if not events:
             return
         
         # Process and emit events
+        emit = self._event_emitter.emit
+        dispatch = self._event_dispatch.get
+        update_info = self._device_info.update
         for event in events:
-            if isinstance(event, GanCubeMoveEvent):
-                self._event_emitter.emit('move', event)
-            elif isinstance(event, GanCubeFaceletsEvent):
-                self._event_emitter.emit('facelets', event)
+            name = dispatch(type(event))
+            if name:
+                emit(name, event)
             elif isinstance(event, GanCubeOrientationEvent):
-                self._event_emitter.emit('orientation', event)
-            elif isinstance(event, GanCubeBatteryEvent):
-                self._event_emitter.emit('battery', event)
+                self._emit_orientation(event)
             elif isinstance(event, GanCubeHardwareEvent):
-                self._device_info.update({
+                update_info({
                     'model': event.model,
                     'firmware': event.firmware,
                     'protocol': event.protocol
                 })
-                self._event_emitter.emit('hardware', event)
+                emit('hardware', event)
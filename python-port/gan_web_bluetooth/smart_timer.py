@@ -2,14 +2,23 @@
 
 import asyncio
 import struct
-from typing import Optional, Callable, List, Dict, Any
+from array import array
+from typing import Optional, Callable, List, Dict, Any, Union
 from dataclasses import dataclass
 from enum import IntEnum
 try:
     from bleak import BleakClient, BleakScanner
+    from bleak.exc import BleakError
 except ImportError:
     BleakClient = BleakScanner = None
+    BleakError = OSError
+try:
+    # Native CRC-16/IBM-3740 (a.k.a. CCITT-FALSE), same parameters as _crc16_ccit
+    from fastcrc.crc16 import ibm_3740 as _native_crc16
+except ImportError:
+    _native_crc16 = None
 from .event_emitter import EventEmitter
+from .utils import DATACLASS_SLOTS
 
 from .definitions import GAN_TIMER_SERVICE
 from .platform_utils import is_bluetooth_available, print_bluetooth_help
@@ -19,6 +28,35 @@ from .platform_utils import is_bluetooth_available, print_bluetooth_help
 GAN_TIMER_TIME_CHARACTERISTIC = "0000fff2-0000-1000-8000-00805f9b34fb"
 GAN_TIMER_STATE_CHARACTERISTIC = "0000fff5-0000-1000-8000-00805f9b34fb"
 
+# Failures tolerated while tearing down a connection
+_TEARDOWN_ERRORS = (BleakError, OSError, asyncio.CancelledError)
+
+# Advertised name prefixes of GAN timers
+_GAN_TIMER_PREFIXES = ('GAN', 'gan', 'Gan')
+
+
+def _build_crc16_ccitt_table() -> array:
+    """Precompute the per-byte CRC-16/CCITT (poly 0x1021) lookup table."""
+    table = array('H')
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+_CRC16_CCITT_TABLE = _build_crc16_ccitt_table()
+
+# Recorded time layout: minutes (u8), seconds (u8), milliseconds (u16 LE)
+_U8U8U16 = struct.Struct('<BBH')
+
+# M:SS.mmm rendering used by GanTimerTime.__str__
+_TIME_FMT = '{}:{:02d}.{:03d}'.format
+
 
 class GanTimerState(IntEnum):
     """GAN Smart Timer states."""
@@ -32,7 +70,7 @@ class GanTimerState(IntEnum):
     FINISHED = 7     # State after STOPPED
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanTimerTime:
     """Representation of time value."""
     minutes: int
@@ -46,14 +84,12 @@ class GanTimerTime:
     
     def __str__(self) -> str:
         """String representation in M:SS.mmm format."""
-        return f"{self.minutes}:{self.seconds:02d}.{self.milliseconds:03d}"
+        return _TIME_FMT(self.minutes, self.seconds, self.milliseconds)
     
     @classmethod
     def from_raw(cls, data: bytes, offset: int = 0) -> 'GanTimerTime':
         """Create from raw timer data."""
-        minutes = data[offset]
-        seconds = data[offset + 1]
-        milliseconds = struct.unpack('<H', data[offset + 2:offset + 4])[0]
+        minutes, seconds, milliseconds = _U8U8U16.unpack_from(data, offset)
         return cls(minutes, seconds, milliseconds)
     
     @classmethod
@@ -65,14 +101,14 @@ class GanTimerTime:
         return cls(minutes, seconds, milliseconds)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanTimerEvent:
     """Timer state event."""
     state: GanTimerState
     recorded_time: Optional[GanTimerTime] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GanTimerRecordedTimes:
     """Recorded time values from timer memory."""
     display_time: GanTimerTime
@@ -162,8 +198,8 @@ class GanSmartTimer:
         self._client = BleakClient(device_address)
         await self._client.connect()
         
-        # Get service and characteristics
-        services = await self._client.get_services()
+        # Get service and characteristics (already discovered by connect)
+        services = self._client.services
         timer_service = services.get_service(GAN_TIMER_SERVICE)
         
         if not timer_service:
@@ -195,20 +231,22 @@ class GanSmartTimer:
         if not self._connected or not self._client:
             return
         
-        try:
-            if self._state_characteristic:
-                await self._client.stop_notify(self._state_characteristic)
-        except:
-            pass
-        
-        try:
-            await self._client.disconnect()
-        except:
-            pass
+        # Overlap the two BLE round-trips; only expected failures are ignored
+        calls = [self._client.disconnect()]
+        if self._state_characteristic:
+            calls.insert(0, self._client.stop_notify(self._state_characteristic))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors = [
+            r for r in results
+            if isinstance(r, BaseException) and not isinstance(r, _TEARDOWN_ERRORS)
+        ]
         
         self._connected = False
         self._client = None
         self._event_emitter.emit('disconnected', None)
+        
+        if errors:
+            raise errors[0]
     
     async def get_recorded_times(self) -> GanTimerRecordedTimes:
         """
@@ -246,10 +284,7 @@ class GanSmartTimer:
         """Scan for GAN Smart Timer device."""
         def detection_callback(device, advertisement_data):
             # Check for GAN timer by name
-            if device.name and any(
-                device.name.startswith(prefix) 
-                for prefix in ["GAN", "gan", "Gan"]
-            ):
+            if device.name and device.name.startswith(_GAN_TIMER_PREFIXES):
                 # Check if it has timer service
                 if GAN_TIMER_SERVICE in (advertisement_data.service_uuids or []):
                     return True
@@ -282,36 +317,39 @@ class GanSmartTimer:
         Returns:
             True if data is valid
         """
-        if len(data) == 0 or data[0] != 0xFE:
+        # Reject on the header (or a frame too short to carry a CRC) before
+        # doing any CRC work
+        if len(data) < 4 or data[0] != 0xFE:
             return False
         
-        # Extract CRC from data
-        event_crc = struct.unpack('<H', data[-2:])[0]
-        
-        # Calculate CRC for data portion
-        calculated_crc = self._crc16_ccit(data[2:-2])
+        # Work on a zero-copy view so neither the CRC nor the payload is sliced out
+        with memoryview(data) as view:
+            # Extract CRC from data
+            event_crc = int.from_bytes(view[-2:], 'little')
+            
+            # Calculate CRC for data portion
+            calculated_crc = self._crc16_ccit(view[2:-2])
         
         return event_crc == calculated_crc
     
-    def _crc16_ccit(self, data: bytes) -> int:
+    def _crc16_ccit(self, data: Union[bytes, memoryview]) -> int:
         """
         Calculate CRC-16/CCIT-FALSE checksum.
         
         Args:
-            data: Data to checksum
+            data: Data to checksum (bytes or an unsigned byte memoryview)
         
         Returns:
             16-bit CRC value
         """
+        if _native_crc16 is not None:
+            return _native_crc16(data)
+        
         crc = 0xFFFF
+        table = _CRC16_CCITT_TABLE
         
         for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
+            crc = ((crc << 8) ^ table[(crc >> 8) ^ byte]) & 0xFFFF
         
         return crc
     
@@ -1,81 +1,102 @@
 """Utility functions for GAN cube operations."""
 
+import sys
 import time
 import math
-from typing import List, Dict, Tuple, Optional, NamedTuple
+from typing import List, Dict, Tuple, Optional, NamedTuple, Union, Sequence
 from dataclasses import dataclass
 import numpy as np
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional; without it kernels run as plain numpy functions
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both decorator forms."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Wall-clock epoch minus the monotonic counter, sampled once at import so
+# timestamps keep epoch meaning but never jump with NTP/clock adjustments
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
 
 def now() -> float:
-    """Get current timestamp in milliseconds."""
-    return time.time() * 1000
+    """Get current monotonic timestamp in milliseconds since the epoch."""
+    return (time.perf_counter_ns() + _EPOCH_OFFSET_NS) / 1_000_000
+
+
+def _facelet_color_table(piece_colors: List[str], twists: int) -> np.ndarray:
+    """Build a (piece, orientation, facelet) table of ASCII color codes."""
+    return np.array([
+        [[ord(colors[(j + o) % twists]) for j in range(twists)] for o in range(twists)]
+        for colors in piece_colors
+    ], dtype=np.uint8)
+
 
+# Center pieces (indices 4, 13, 22, 31, 40, 49 for URFDLB) never move, so
+# they are baked into the template every facelet string starts from
+_FACELETS_TEMPLATE = np.full(54, ord('X'), dtype=np.uint8)
+_FACELETS_TEMPLATE[[4, 13, 22, 31, 40, 49]] = np.frombuffer(b'URFDLB', dtype=np.uint8)
 
-def to_kociemba_facelets(cp: List[int], co: List[int], ep: List[int], eo: List[int]) -> str:
+# Facelet indices of each corner slot (top corners, then bottom corners)
+_CORNER_FACELETS = np.array([
+    [0, 9, 20], [2, 36, 11], [8, 18, 38], [6, 27, 29],
+    [51, 35, 17], [53, 26, 44], [47, 15, 42], [45, 24, 33]
+], dtype=np.intp)
+
+# Corner piece colors, pre-rotated for every orientation
+_CORNER_COLORS = _facelet_color_table(
+    ['URF', 'UBR', 'ULB', 'UFL', 'DFR', 'DRB', 'DBL', 'DLF'], 3
+)
+
+# Facelet indices of each edge slot (top, bottom, then middle edges)
+_EDGE_FACELETS = np.array([
+    [1, 37], [5, 10], [7, 19], [3, 28],
+    [52, 16], [50, 43], [46, 25], [48, 34],
+    [12, 21], [14, 23], [32, 41], [30, 39]
+], dtype=np.intp)
+
+# Edge piece colors, pre-flipped for both orientations
+_EDGE_COLORS = _facelet_color_table(
+    ['UF', 'UR', 'UB', 'UL', 'DF', 'DR', 'DB', 'DL', 'FR', 'FL', 'BR', 'BL'], 2
+)
+
+
+def to_kociemba_facelets(cp: Sequence[int], co: Sequence[int],
+                         ep: Sequence[int], eo: Sequence[int]) -> str:
     """
     Convert CP/CO/EP/EO arrays to Kociemba facelet string representation.
     
+    All 20 pieces are placed with two fancy-index assignments into a
+    byte buffer using the precomputed slot and color tables.
+    
     Args:
-        cp: Corner permutation array
-        co: Corner orientation array
-        ep: Edge permutation array
-        eo: Edge orientation array
+        cp: Corner permutation array (list or uint8 ndarray)
+        co: Corner orientation array (list or uint8 ndarray)
+        ep: Edge permutation array (list or uint8 ndarray)
+        eo: Edge orientation array (list or uint8 ndarray)
     
     Returns:
         54-character string representing cube state in Kociemba format
     """
-    facelets = ['X'] * 54
-    
-    # Set center pieces (indices 4, 13, 22, 31, 40, 49 for URFDLB)
-    centers = [4, 13, 22, 31, 40, 49]
-    center_colors = 'URFDLB'
-    for pos, color in zip(centers, center_colors):
-        facelets[pos] = color
-    
-    # Set corner pieces
-    corner_positions = [
-        [0, 9, 20], [2, 36, 11], [8, 18, 38], [6, 27, 29],  # Top corners
-        [51, 35, 17], [53, 26, 44], [47, 15, 42], [45, 24, 33]  # Bottom corners
-    ]
-    
-    corner_colors = [
-        ['U', 'R', 'F'], ['U', 'B', 'R'], ['U', 'L', 'B'], ['U', 'F', 'L'],
-        ['D', 'F', 'R'], ['D', 'R', 'B'], ['D', 'B', 'L'], ['D', 'L', 'F']
-    ]
-    
-    for i in range(8):
-        piece = cp[i]
-        orientation = co[i]
-        positions = corner_positions[i]
-        colors = corner_colors[piece]
-        
-        for j in range(3):
-            facelets[positions[j]] = colors[(j + orientation) % 3]
-    
-    # Set edge pieces
-    edge_positions = [
-        [1, 37], [5, 10], [7, 19], [3, 28],  # Top edges
-        [52, 16], [50, 43], [46, 25], [48, 34],  # Bottom edges
-        [12, 21], [14, 23], [32, 41], [30, 39]   # Middle edges
+    facelets = _FACELETS_TEMPLATE.copy()
+    facelets[_CORNER_FACELETS] = _CORNER_COLORS[
+        np.asarray(cp, dtype=np.intp), np.asarray(co, dtype=np.intp) % 3
     ]
-    
-    edge_colors = [
-        ['U', 'F'], ['U', 'R'], ['U', 'B'], ['U', 'L'],
-        ['D', 'F'], ['D', 'R'], ['D', 'B'], ['D', 'L'],
-        ['F', 'R'], ['F', 'L'], ['B', 'R'], ['B', 'L']
+    facelets[_EDGE_FACELETS] = _EDGE_COLORS[
+        np.asarray(ep, dtype=np.intp), np.asarray(eo, dtype=np.intp) & 1
     ]
-    
-    for i in range(12):
-        piece = ep[i]
-        orientation = eo[i]
-        positions = edge_positions[i]
-        colors = edge_colors[piece]
-        
-        facelets[positions[0]] = colors[orientation]
-        facelets[positions[1]] = colors[1 - orientation]
-    
-    return ''.join(facelets)
+    return facelets.tobytes().decode('ascii')
 
 
 @dataclass
@@ -85,13 +106,19 @@ class LinearFitResult:
     intercept: float
 
 
-def cube_timestamp_linear_fit(data_points: List[Dict[str, float]]) -> LinearFitResult:
+def cube_timestamp_linear_fit(
+    data_points: Union[List[Dict[str, float]], np.ndarray]
+) -> LinearFitResult:
     """
     Perform linear regression on cube timestamp vs host timestamp data points
     to compensate for cube clock drift and synchronize timestamps.
     
+    The least-squares sums are computed with NumPy on mean-centered data,
+    which keeps millisecond epoch timestamps from cancelling out.
+    
     Args:
-        data_points: List of dicts with 'cube_time' and 'host_time' keys
+        data_points: List of dicts with 'cube_time' and 'host_time' keys,
+                     or an (N, 2) array of (cube_time, host_time) rows
     
     Returns:
         LinearFitResult with slope and intercept
@@ -99,28 +126,32 @@ def cube_timestamp_linear_fit(data_points: List[Dict[str, float]]) -> LinearFitR
     if len(data_points) < 2:
         return LinearFitResult(slope=1.0, intercept=0.0)
     
-    n = len(data_points)
-    sum_x = sum_y = sum_xy = sum_xx = 0.0
+    if isinstance(data_points, np.ndarray):
+        points = data_points
+    else:
+        points = np.array(
+            [(point['cube_time'], point['host_time']) for point in data_points],
+            dtype=np.float64
+        )
     
-    for point in data_points:
-        x = point['cube_time']
-        y = point['host_time']
-        sum_x += x
-        sum_y += y
-        sum_xy += x * y
-        sum_xx += x * x
+    n = len(points)
+    x = points[:, 0]
+    y = points[:, 1]
+    mean_x = x.mean()
+    mean_y = y.mean()
+    dx = x - mean_x
     
-    denominator = n * sum_xx - sum_x * sum_x
+    denominator = n * float(dx @ dx)
     if abs(denominator) < 1e-10:  # Avoid division by zero
         return LinearFitResult(slope=1.0, intercept=0.0)
     
-    slope = (n * sum_xy - sum_x * sum_y) / denominator
-    intercept = (sum_y - slope * sum_x) / n
+    slope = n * float(dx @ (y - mean_y)) / denominator
+    intercept = float(mean_y - slope * mean_x)
     
     return LinearFitResult(slope=slope, intercept=intercept)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Quaternion:
     """Quaternion for orientation calculations."""
     x: float
@@ -130,12 +161,131 @@ class Quaternion:
     
     def to_array(self) -> np.ndarray:
         """Convert to numpy array."""
-        return np.array([self.x, self.y, self.z, self.w])
+        # A tuple is parsed faster than a list; the scalar fields stay the
+        # canonical storage since the quaternion kernels read them directly
+        return np.array((self.x, self.y, self.z, self.w), dtype=np.float64)
     
     @classmethod
     def from_array(cls, arr: np.ndarray) -> 'Quaternion':
         """Create from numpy array."""
-        return cls(x=arr[0], y=arr[1], z=arr[2], w=arr[3])
+        x, y, z, w = arr[:4].tolist()
+        return cls(x=x, y=y, z=z, w=w)
+
+
+# Scalar quaternion kernels on unpacked (x, y, z, w) components; the public
+# Quaternion functions below are thin wrappers around them
+
+@njit(cache=True, fastmath=True)
+def _hamilton_product(x1: float, y1: float, z1: float, w1: float,
+                      x2: float, y2: float, z2: float, w2: float) -> tuple:
+    """Hamilton product q1 * q2."""
+    return (
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    )
+
+
+def _slerp_coefficients(one_plus_mu: float) -> Tuple[tuple, tuple]:
+    """Series coefficients u[i], v[i] of Eberly's fast SLERP (8 terms)."""
+    u = [1.0 / (k * (2.0 * k + 1.0)) for k in range(1, 8)]
+    v = [k / (2.0 * k + 1.0) for k in range(1, 8)]
+    u.append(one_plus_mu / (8.0 * 17.0))
+    v.append(one_plus_mu * 8.0 / 17.0)
+    return tuple(u), tuple(v)
+
+
+# 1 + mu tunes the truncated last term; results stay within ~4e-5 of exact SLERP
+_SLERP_U, _SLERP_V = _slerp_coefficients(1.90110745351730037)
+
+
+@njit(cache=True, fastmath=True)
+def _slerp(x1: float, y1: float, z1: float, w1: float,
+           x2: float, y2: float, z2: float, w2: float, t: float) -> tuple:
+    """SLERP from q1 to q2, taking the shorter path."""
+    # Clamp interpolation parameter
+    t = max(0.0, min(1.0, t))
+    
+    # If dot product is negative, negate one quaternion to take shorter path
+    dot = x1 * x2 + y1 * y2 + z1 * z2 + w1 * w2
+    if dot < 0.0:
+        x2, y2, z2, w2 = -x2, -y2, -z2, -w2
+        dot = -dot
+    
+    # If inputs are too close, linearly interpolate and renormalize
+    if dot > 0.9995:
+        x = x1 + t * (x2 - x1)
+        y = y1 + t * (y2 - y1)
+        z = z1 + t * (z2 - z1)
+        w = w1 + t * (w2 - w1)
+        length = math.sqrt(x * x + y * y + z * z + w * w)
+        if length == 0:
+            return (0.0, 0.0, 0.0, 1.0)
+        return (x / length, y / length, z / length, w / length)
+    
+    if HAS_NUMBA:
+        # Eberly's polynomial SLERP: the sin(k*theta)/sin(theta) weights are
+        # evaluated as nested Horner series in (dot - 1), so no acos/sin calls
+        xm1 = dot - 1.0
+        d = 1.0 - t
+        sqr_t = t * t
+        sqr_d = d * d
+        c_t = 1.0
+        c_d = 1.0
+        for i in range(7, -1, -1):
+            c_t = 1.0 + (_SLERP_U[i] * sqr_t - _SLERP_V[i]) * xm1 * c_t
+            c_d = 1.0 + (_SLERP_U[i] * sqr_d - _SLERP_V[i]) * xm1 * c_d
+        c_t *= t
+        c_d *= d
+    else:
+        # Interpreted, a few libm calls are cheaper than the 16-step loop
+        theta0 = math.acos(dot)
+        sin_theta0 = math.sin(theta0)
+        
+        theta = theta0 * t
+        sin_theta = math.sin(theta)
+        
+        c_d = math.cos(theta) - dot * sin_theta / sin_theta0
+        c_t = sin_theta / sin_theta0
+    
+    return (
+        c_d * x1 + c_t * x2,
+        c_d * y1 + c_t * y2,
+        c_d * z1 + c_t * z2,
+        c_d * w1 + c_t * w2
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _to_euler(x: float, y: float, z: float, w: float) -> tuple:
+    """(roll, pitch, yaw) in degrees of the normalized quaternion."""
+    norm = math.sqrt(x * x + y * y + z * z + w * w)
+    if norm == 0:
+        return (0.0, 0.0, 0.0)
+    x, y, z, w = x / norm, y / norm, z / norm, w / norm
+    
+    # Roll (x-axis rotation)
+    roll = math.atan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+    
+    # Pitch (y-axis rotation); use 90 degrees if out of range
+    sinp = 2 * (w * y - z * x)
+    if abs(sinp) >= 1:
+        pitch = math.copysign(math.pi / 2, sinp)
+    else:
+        pitch = math.asin(sinp)
+    
+    # Yaw (z-axis rotation)
+    yaw = math.atan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+    
+    return (math.degrees(roll), math.degrees(pitch), math.degrees(yaw))
+
+
+if HAS_NUMBA:
+    # Compile on import so the first orientation sample doesn't pay the JIT cost
+    _hamilton_product(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+    _slerp(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.5)
+    _to_euler(0.0, 0.0, 0.0, 1.0)
 
 
 def normalize_quaternion(q: Quaternion) -> Quaternion:
@@ -164,43 +314,8 @@ def slerp_quaternions(q1: Quaternion, q2: Quaternion, t: float) -> Quaternion:
     Returns:
         Interpolated quaternion
     """
-    # Clamp interpolation parameter
-    t = max(0, min(1, t))
-    
-    # Calculate dot product
-    dot = q1.x * q2.x + q1.y * q2.y + q1.z * q2.z + q1.w * q2.w
-    
-    # If dot product is negative, negate one quaternion to take shorter path
-    if dot < 0.0:
-        q2 = Quaternion(x=-q2.x, y=-q2.y, z=-q2.z, w=-q2.w)
-        dot = -dot
-    
-    # If inputs are too close, linearly interpolate
-    if dot > 0.9995:
-        result = Quaternion(
-            x=q1.x + t * (q2.x - q1.x),
-            y=q1.y + t * (q2.y - q1.y),
-            z=q1.z + t * (q2.z - q1.z),
-            w=q1.w + t * (q2.w - q1.w)
-        )
-        return normalize_quaternion(result)
-    
-    # Calculate the half angle between quaternions
-    theta0 = math.acos(abs(dot))
-    sin_theta0 = math.sin(theta0)
-    
-    theta = theta0 * t
-    sin_theta = math.sin(theta)
-    
-    s0 = math.cos(theta) - dot * sin_theta / sin_theta0
-    s1 = sin_theta / sin_theta0
-    
-    return Quaternion(
-        x=s0 * q1.x + s1 * q2.x,
-        y=s0 * q1.y + s1 * q2.y,
-        z=s0 * q1.z + s1 * q2.z,
-        w=s0 * q1.w + s1 * q2.w
-    )
+    x, y, z, w = _slerp(q1.x, q1.y, q1.z, q1.w, q2.x, q2.y, q2.z, q2.w, t)
+    return Quaternion(x=x, y=y, z=z, w=w)
 
 
 def quaternion_angular_distance(q1: Quaternion, q2: Quaternion) -> float:
@@ -218,15 +333,67 @@ def quaternion_angular_distance(q1: Quaternion, q2: Quaternion) -> float:
     return 2 * math.acos(min(1.0, dot))
 
 
+class OrientationBuffer:
+    """
+    Fixed-size ring buffer of orientation samples.
+    
+    Quaternions and timestamps are kept as parallel (N, 4) and (N,) arrays
+    rather than per-sample objects, so windows can be fed straight to the
+    vectorized smoothing.
+    """
+    
+    __slots__ = ('quats', 'timestamps', '_head', '_count')
+    
+    def __init__(self, size: int):
+        self.quats = np.zeros((size, 4), dtype=np.float64)
+        self.timestamps = np.zeros(size, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, quat: Quaternion, timestamp: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        head = self._head
+        self.quats[head] = (quat.x, quat.y, quat.z, quat.w)
+        self.timestamps[head] = timestamp
+        size = len(self.timestamps)
+        self._head = (head + 1) % size
+        if self._count < size:
+            self._count += 1
+    
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the most recent samples in chronological order.
+        
+        Args:
+            n: Number of samples (capped at the number stored)
+        
+        Returns:
+            Tuple of ((n, 4) quaternions, (n,) timestamps)
+        """
+        n = min(n, self._count)
+        index = (self._head - n + np.arange(n)) % len(self.timestamps)
+        return self.quats[index], self.timestamps[index]
+
+
 def smooth_orientation_data(
-    orientations: List[Dict[str, any]], 
+    orientations: Union[List[Dict[str, any]], np.ndarray], 
     window_size: int = 3
 ) -> Optional[Quaternion]:
     """
     Smooth orientation data using a rolling average with SLERP.
     
+    The newest sample carries weight 1.0, so the result is the newest
+    sample itself; the earlier SLERP steps only pick its hemisphere and
+    whether it is renormalized. That last step is resolved directly
+    instead of running the full interpolation.
+    
     Args:
-        orientations: List of dicts with 'quaternion' and 'timestamp' keys
+        orientations: List of dicts with 'quaternion' and 'timestamp' keys,
+                      or an (N, 4) array of (x, y, z, w) rows (extra columns,
+                      such as a timestamp, are ignored)
         window_size: Number of recent samples to average
     
     Returns:
@@ -237,14 +404,32 @@ def smooth_orientation_data(
     
     # Use most recent orientations within window
     recent = orientations[-window_size:]
+    if isinstance(recent, np.ndarray):
+        rows = recent[:, :4].tolist()
+    else:
+        rows = [(q.x, q.y, q.z, q.w) for q in (sample['quaternion'] for sample in recent)]
+    
+    count = len(rows)
+    if count == 1:
+        return Quaternion(*rows[0])
     
     # Weight more recent samples higher
-    result = recent[0]['quaternion']
-    for i in range(1, len(recent)):
-        weight = i / (len(recent) - 1)
-        result = slerp_quaternions(result, recent[i]['quaternion'], weight)
+    x, y, z, w = rows[0]
+    for i in range(1, count - 1):
+        x, y, z, w = _slerp(x, y, z, w, *rows[i], i / (count - 1))
     
-    return result
+    # Final step at t=1.0: same shorter-path flip and nlerp cutoff as _slerp
+    nx, ny, nz, nw = rows[-1]
+    dot = x * nx + y * ny + z * nz + w * nw
+    if dot < 0.0:
+        nx, ny, nz, nw = -nx, -ny, -nz, -nw
+        dot = -dot
+    if dot > 0.9995:
+        length = math.sqrt(nx * nx + ny * ny + nz * nz + nw * nw)
+        if length == 0:
+            return Quaternion(x=0.0, y=0.0, z=0.0, w=1.0)
+        return Quaternion(x=nx / length, y=ny / length, z=nz / length, w=nw / length)
+    return Quaternion(x=nx, y=ny, z=nz, w=nw)
 
 
 def multiply_quaternions(q1: Quaternion, q2: Quaternion) -> Quaternion:
@@ -258,12 +443,8 @@ def multiply_quaternions(q1: Quaternion, q2: Quaternion) -> Quaternion:
     Returns:
         Product quaternion
     """
-    return Quaternion(
-        x=q1.w * q2.x + q1.x * q2.w + q1.y * q2.z - q1.z * q2.y,
-        y=q1.w * q2.y - q1.x * q2.z + q1.y * q2.w + q1.z * q2.x,
-        z=q1.w * q2.z + q1.x * q2.y - q1.y * q2.x + q1.z * q2.w,
-        w=q1.w * q2.w - q1.x * q2.x - q1.y * q2.y - q1.z * q2.z
-    )
+    x, y, z, w = _hamilton_product(q1.x, q1.y, q1.z, q1.w, q2.x, q2.y, q2.z, q2.w)
+    return Quaternion(x=x, y=y, z=z, w=w)
 
 
 def inverse_quaternion(q: Quaternion) -> Quaternion:
@@ -297,6 +478,11 @@ FACE_QUATERNIONS = {
     'orange_top_white_front': Quaternion(x=0.257, y=0.673, z=-0.265, w=0.642)
 }
 
+# Our chosen "home" position (white top, green front) and its inverse,
+# computed once and shared by every CubeOrientationTransform
+_HOME_QUATERNION = Quaternion(x=-0.008, y=-0.011, z=0.390, w=0.921)
+_HOME_QUATERNION_INVERSE = inverse_quaternion(_HOME_QUATERNION)
+
 
 class CubeOrientationTransform:
     """
@@ -313,8 +499,8 @@ class CubeOrientationTransform:
     
     def __init__(self):
         # The quaternion for our chosen "home" position (white top, green front)
-        self.HOME_QUATERNION = Quaternion(x=-0.008, y=-0.011, z=0.390, w=0.921)
-        self.HOME_QUATERNION_INVERSE = inverse_quaternion(self.HOME_QUATERNION)
+        self.HOME_QUATERNION = _HOME_QUATERNION
+        self.HOME_QUATERNION_INVERSE = _HOME_QUATERNION_INVERSE
     
     def normalize_orientation(self, raw_quat: Quaternion) -> Quaternion:
         """
@@ -347,29 +533,38 @@ class CubeOrientationTransform:
         """Get reference quaternions for standard cube positions."""
         return FACE_QUATERNIONS
     
-    def is_factory_default(self, quat: Quaternion) -> bool:
+    def is_factory_default(self, quat: Union[Quaternion, np.ndarray]) -> Union[bool, np.ndarray]:
         """
         Check if cube is near factory default orientation.
         
         Args:
-            quat: Quaternion to check
+            quat: Quaternion to check, or a (..., 4) array of (x, y, z, w) rows
         
         Returns:
-            True if near factory default (w ≈ -1)
+            True if near factory default (w ≈ -1); a boolean mask for arrays
         """
+        if isinstance(quat, np.ndarray):
+            return np.abs(quat[..., 3] + 1.0) < 0.1
         return abs(quat.w + 1) < 0.1
     
-    def filter_noise(self, quat: Quaternion, threshold: float = 0.02) -> Quaternion:
+    def filter_noise(self, quat: Union[Quaternion, np.ndarray],
+                     threshold: float = 0.02) -> Union[Quaternion, np.ndarray]:
         """
         Filter out sensor noise from quaternion values.
         
         Args:
-            quat: Input quaternion
+            quat: Input quaternion, or a (..., 4) array of (x, y, z, w) rows
             threshold: Noise threshold
         
         Returns:
-            Filtered quaternion
+            Filtered quaternion (a new array for array input)
         """
+        if isinstance(quat, np.ndarray):
+            # Branchless: small vector components are multiplied by zero
+            filtered = np.array(quat, dtype=np.float64)
+            vector = filtered[..., :3]
+            vector *= np.abs(vector) >= threshold
+            return filtered
         return Quaternion(
             x=0 if abs(quat.x) < threshold else quat.x,
             y=0 if abs(quat.y) < threshold else quat.y,
@@ -388,33 +583,4 @@ def quaternion_to_euler(quat: Quaternion) -> Tuple[float, float, float]:
     Returns:
         Tuple of (roll, pitch, yaw) in degrees
     """
-    # Normalize quaternion first
-    norm = math.sqrt(quat.x*quat.x + quat.y*quat.y + quat.z*quat.z + quat.w*quat.w)
-    if norm == 0:
-        return (0.0, 0.0, 0.0)
-    
-    x, y, z, w = quat.x/norm, quat.y/norm, quat.z/norm, quat.w/norm
-    
-    # Roll (x-axis rotation)
-    sinr_cosp = 2 * (w * x + y * z)
-    cosr_cosp = 1 - 2 * (x * x + y * y)
-    roll = math.atan2(sinr_cosp, cosr_cosp)
-    
-    # Pitch (y-axis rotation)
-    sinp = 2 * (w * y - z * x)
-    if abs(sinp) >= 1:
-        pitch = math.copysign(math.pi / 2, sinp)  # Use 90 degrees if out of range
-    else:
-        pitch = math.asin(sinp)
-    
-    # Yaw (z-axis rotation)
-    siny_cosp = 2 * (w * z + x * y)
-    cosy_cosp = 1 - 2 * (y * y + z * z)
-    yaw = math.atan2(siny_cosp, cosy_cosp)
-    
-    # Convert to degrees
-    roll_deg = math.degrees(roll)
-    pitch_deg = math.degrees(pitch)
-    yaw_deg = math.degrees(yaw)
-    
-    return (roll_deg, pitch_deg, yaw_deg)
\ No newline at end of file
+    return _to_euler(quat.x, quat.y, quat.z, quat.w)